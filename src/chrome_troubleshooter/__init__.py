@@ -9,26 +9,48 @@ __version__ = "0.2.0b0"
 __author__ = "swipswaps"
 __description__ = "Advanced Chrome crash diagnosis and auto-remediation tool"
 
-# CIRCULAR DEPENDENCY FIX: NO imports to prevent import loops
+# CIRCULAR DEPENDENCY FIX: NO eager imports to prevent import loops
 # Following ChatGPT audit recommendation for zero-dependency __init__.py
 #
-# CRITICAL FIX: Removed ALL imports that cause circular dependencies
-# Users should import specific modules directly:
-# - from chrome_troubleshooter.constants import get_cache_dir
-# - from chrome_troubleshooter.launcher import safe_launch
-# - from chrome_troubleshooter.logger import StructuredLogger
+# LAZY RE-EXPORTS (PEP 562):
+# The convenience names below are resolved by the module-level __getattr__
+# on first attribute access and then cached in globals(). Importing the
+# package itself still loads NOTHING, so `chrome-troubleshooter --help`
+# and `--version` never pay for sqlite3, subprocess or Rich.
 #
 # IMPORT STRATEGY EXPLANATION:
-# - Import NOTHING to prevent any circular dependencies
-# - Keep __all__ empty to force explicit imports
-# - This ensures fast, reliable imports for IDEs and tools
-# No imports here - users import modules directly
+# - `import chrome_troubleshooter` stays free of side effects and imports
+# - `chrome_troubleshooter.Config` imports .config only when touched
+# - Direct module imports keep working and remain the preferred style:
+#   from chrome_troubleshooter.constants import get_cache_dir
+#   from chrome_troubleshooter.launcher import safe_launch
+#   from chrome_troubleshooter.logger import StructuredLogger
+_LAZY = {
+    "Config": ".config",
+    "StructuredLogger": ".logger",
+    "safe_launch": ".launcher",
+    "collect_all": ".diagnostics",
+}
 
+# The lazy names are deliberately NOT listed in __all__: a star import
+# would resolve them all, importing the launcher, logger (sqlite3) and
+# diagnostics modules up front.
 __all__ = [
     "__version__",      # Version string
-    # Note: All other imports removed to prevent circular dependencies
-    # Users should import modules directly:
-    # from chrome_troubleshooter.constants import get_cache_dir
-    # from chrome_troubleshooter.launcher import safe_launch
-    # from chrome_troubleshooter.logger import StructuredLogger
 ]
+
+
+def __getattr__(name):
+    """Import lazily re-exported names on first access and cache them."""
+    if name in _LAZY:
+        import importlib
+
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
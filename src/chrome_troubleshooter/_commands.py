@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Command bodies shared by the cli_simple and cli_typer front ends.
+
+Both CLIs only bind Typer options and apply their overrides to the Config;
+the launch/diagnose work, error handling and the single-instance entry
+point live here, so each is written (and optimized) once.
+"""
+
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+import typer
+from rich.console import Console
+
+from .config import Config
+from .constants import LOCK_FILE
+from .utils import acquire_instance_lock, create_session_dir, write_json
+
+# DEFERRED IMPORTS: rich.panel/rich.progress and the launcher, diagnostics
+# and logger modules are imported by the launch/diagnose helpers, so status,
+# version and --help never load them.
+
+
+def apply_verbosity(config: Config, verbose: int) -> None:
+    """Raise the log level for -v (INFO) and -vv (DEBUG)"""
+    if verbose >= 2:
+        config.log_level = "DEBUG"
+    elif verbose >= 1:
+        config.log_level = "INFO"
+
+
+@contextmanager
+def command_errors(console: Console, verbose: int = 0):
+    """Turn Ctrl-C and unexpected errors into a message and exit code"""
+    try:
+        yield
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
+        raise typer.Exit(130)
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        if verbose >= 2:
+            # Only formatted when asked for. Streamed to stderr line by line
+            # rather than built into one string and run through Rich, which
+            # would also read any [brackets] in it as markup
+            import traceback
+            traceback.print_exc(file=sys.stderr)
+        raise typer.Exit(1)
+
+
+def check_system_dependencies() -> dict:
+    """Check if required system dependencies are available."""
+    deps = {
+        "chrome": bool(shutil.which("google-chrome") or shutil.which("google-chrome-stable")),
+        "journalctl": bool(shutil.which("journalctl")),
+        "dmesg": bool(shutil.which("dmesg")),
+        "flock": bool(shutil.which("flock")),
+        "flatpak": bool(shutil.which("flatpak")),
+    }
+    return deps
+
+
+def _progress(console: Console):
+    """Spinner for long-running commands"""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    # No spinner when output is piped or redirected: a disabled Progress
+    # never starts the Live refresh thread or emits escape sequences
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        disable=not console.is_terminal,
+    )
+
+
+def _print_result(console: Console, ok: bool, message: str, detail: str) -> None:
+    """Show a launch outcome: a Rich panel on a terminal, one line otherwise"""
+    color, title = ("green", "Success") if ok else ("red", "Failure")
+    if not console.is_terminal:
+        # Piped or scripted runs check the exit code; skip the panel's
+        # markup parsing and box layout and print plain text
+        console.print(f"{message}. {detail}", markup=False, highlight=False)
+        return
+
+    from rich.panel import Panel
+
+    console.print(Panel.fit(
+        f"[{color}]{'✅' if ok else '❌'} {message}![/{color}]\n{detail}",
+        title=title,
+        border_style=color
+    ))
+
+
+def run_launch(console: Console, config: Config) -> int:
+    """Launch Chrome in a new session directory and report the outcome"""
+    session_dir = create_session_dir(config.base_dir)
+
+    with _progress(console) as progress:
+        task = progress.add_task("Initializing Chrome troubleshooter...", total=None)
+
+        # Initialize logger
+        from .logger import StructuredLogger
+        with StructuredLogger(session_dir, config) as logger:
+            progress.update(task, description="Starting Chrome launcher...")
+
+            # Initialize launcher
+            from .launcher import ChromeLauncher
+            launcher = ChromeLauncher(config, logger)
+
+            progress.update(task, description="Launching Chrome with troubleshooting...")
+
+            # Launch Chrome
+            success = launcher.launch()
+
+            if success:
+                progress.update(task, description="✅ Chrome launched successfully!")
+                _print_result(console, True, "Chrome launched successfully",
+                              f"Session logs: {session_dir}")
+                return 0
+            else:
+                progress.update(task, description="❌ Chrome launch failed")
+                _print_result(console, False, "Chrome launch failed after all attempts",
+                              f"Check logs: {session_dir}")
+                return 1
+
+
+def run_diagnose(
+    console: Console,
+    config: Config,
+    output: Optional[Path],
+    report: Callable[[dict], None],
+) -> int:
+    """Collect diagnostics, show them with report() and optionally save them"""
+    session_dir = create_session_dir(config.base_dir)
+
+    with _progress(console) as progress:
+        task = progress.add_task("Running diagnostics...", total=None)
+
+        # Initialize logger
+        from .logger import StructuredLogger
+        with StructuredLogger(session_dir, config) as logger:
+            progress.update(task, description="Collecting system information...")
+
+            # Initialize diagnostics collector
+            from .diagnostics import DiagnosticsCollector
+            collector = DiagnosticsCollector(config, logger)
+
+            progress.update(task, description="Analyzing system environment...")
+
+            # Collect diagnostics
+            diagnostics = collector.collect_all()
+
+            progress.update(task, description="Generating report...")
+
+            # Display results
+            report(diagnostics)
+
+            # Save to file if requested
+            if output:
+                write_json(output, diagnostics)
+                console.print(f"[green]✅ Diagnostics saved to: {output}[/green]")
+
+            console.print(f"[blue]📁 Session logs: {session_dir}[/blue]")
+            return 0
+
+
+def run_locked(console: Console, app: typer.Typer) -> None:
+    """Run app unless another instance holds the single-instance lock"""
+    try:
+        # Prevent multiple instances: an atomic, kernel-released flock
+        lock_fd = acquire_instance_lock(LOCK_FILE)
+        if lock_fd is None:
+            console.print("[red]❌ Another instance is already running[/red]")
+            sys.exit(1)
+
+        try:
+            app()
+        finally:
+            os.close(lock_fd)
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
+        sys.exit(130)
+    except Exception as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
+        sys.exit(1)
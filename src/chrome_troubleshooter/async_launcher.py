@@ -6,7 +6,11 @@ Enhanced launcher with concurrent diagnostics collection
 
 import asyncio
 import contextlib
+import functools
+import os
+import platform
 import shutil
+import sys
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -17,7 +21,106 @@ from .config import Config
 from .logger import StructuredLogger
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _have(name: str) -> bool:
+    """Return True if name is on PATH, probed once per process."""
+    return shutil.which(name) is not None
+
+
+# asyncio.timeout (3.11+) cancels the current task in place, whereas
+# wait_for wraps every awaitable in a new Task before 3.12. The monitors
+# below await once per output line, so that Task churn adds up.
+_ASYNC_TIMEOUT = getattr(asyncio, "timeout", None)
+
+
+async def _with_timeout(awaitable, timeout: float):
+    """Await with a deadline, raising asyncio.TimeoutError when it passes."""
+    if _ASYNC_TIMEOUT is None:
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+    async with _ASYNC_TIMEOUT(timeout):
+        return await awaitable
+
+
+_CHROME_CANDIDATES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "google-chrome-beta",
+    "google-chrome-dev",
+    "chromium",
+    "chromium-browser",
+    "/usr/bin/google-chrome",
+    "/usr/bin/google-chrome-stable",
+    "/opt/google/chrome/chrome",
+)
+
+
+def _scan_chrome_paths() -> List[str]:
+    """Return every Chrome candidate that resolves on PATH."""
+    return [path for path in _CHROME_CANDIDATES if shutil.which(path)]
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_chrome_paths(path_env: str) -> tuple:
+    """Memoized _scan_chrome_paths() keyed on the PATH it was resolved against."""
+    # Nine shutil.which() calls each stat every PATH directory; launchers are
+    # built once per attempt cycle, so repeat the scan only if PATH changes
+    return tuple(_scan_chrome_paths())
+
+
+@functools.lru_cache(maxsize=None)
+def _static_system_info() -> Dict[str, Any]:
+    """System facts that are fixed for the life of the process, read once."""
+    return {
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+        "cpu_count": psutil.cpu_count(),
+        "memory_total": psutil.virtual_memory().total,
+    }
+
+
+async def _iter_lines(stream: asyncio.StreamReader, duration: float, chunk_size: int = 65536):
+    """
+    Yield complete lines (as bytes, without b"\\n") from stream for duration seconds.
+
+    Reads in chunks under one overall deadline instead of one timed
+    readline() per line, so a burst of output costs one wakeup per chunk.
+    A trailing partial line is yielded at EOF.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+    pending = b""
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return
+        try:
+            chunk = await _with_timeout(stream.read(chunk_size), remaining)
+        except asyncio.TimeoutError:
+            return
+        if not chunk:
+            break
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+def _kill_quietly(process) -> None:
+    """Stop a follow-mode monitor process, ignoring one that already exited."""
+    with contextlib.suppress(ProcessLookupError):
+        process.kill()
+
+
+# Forces XWayland: Chrome's native Wayland backend is a common crash source
+_WAYLAND_FLAGS = ("--ozone-platform=x11", "--disable-features=UseOzonePlatform")
+
+
+# slots=True drops the per-instance __dict__; the flag only exists on 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class LaunchAttempt:
     """Data class for tracking launch attempts."""
     attempt_number: int
@@ -33,32 +136,48 @@ class LaunchAttempt:
 class AsyncChromeLauncher:
     """Async Chrome launcher with concurrent diagnostics."""
 
+    # Progressive launch strategies, built once rather than on every launch
+    _STRATEGIES = (
+        ("vanilla", ()),
+        ("no_gpu", ("--disable-gpu",)),
+        ("no_vaapi", ("--disable-gpu", "--disable-features=VaapiVideoDecoder")),
+        ("safe_mode", ("--disable-gpu", "--no-sandbox", "--incognito")),
+    )
+
     def __init__(self, config: Config, logger: StructuredLogger):
         self.config = config
         self.logger = logger
-        self.chrome_paths = self._find_chrome_paths()
+        # Resolved once per PATH value and shared by every launcher instance
+        self.chrome_paths = list(_cached_chrome_paths(os.environ.get("PATH", "")))
         self.attempts: List[LaunchAttempt] = []
+        # The SELinux rule is process-wide state; check it once per launcher
+        # rather than forking getenforce/sudo on every retry strategy
+        self._selinux_checked = False
+        # Created inside the running loop (an Event made here would bind to
+        # the wrong loop on Python < 3.10); see request_stop()
+        self._stop: Optional[asyncio.Event] = None
+        # Background terminate/kill tasks for rejected launch attempts; held
+        # here so they aren't garbage collected while still running
+        self._reapers: set = set()
 
     def _find_chrome_paths(self) -> List[str]:
         """Find available Chrome executables."""
-        possible_paths = [
-            "google-chrome",
-            "google-chrome-stable",
-            "google-chrome-beta",
-            "google-chrome-dev",
-            "chromium",
-            "chromium-browser",
-            "/usr/bin/google-chrome",
-            "/usr/bin/google-chrome-stable",
-            "/opt/google/chrome/chrome",
-        ]
-
-        found_paths = []
-        for path in possible_paths:
-            if shutil.which(path):
-                found_paths.append(path)
-
-        return found_paths
+        return _scan_chrome_paths()
+
+    def request_stop(self) -> None:
+        """Ask a running launch loop to stop before its next attempt."""
+        # Safe to call from a signal handler registered with
+        # loop.add_signal_handler(), i.e. on the loop thread
+        if self._stop is not None:
+            self._stop.set()
+
+    async def _stop_requested_within(self, delay: float) -> bool:
+        """Wait up to delay seconds, returning early (True) if a stop is requested."""
+        try:
+            await _with_timeout(self._stop.wait(), delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     async def launch_with_concurrent_diagnostics(self) -> bool:
         """Launch Chrome with concurrent diagnostics collection."""
@@ -66,27 +185,30 @@ class AsyncChromeLauncher:
             self.logger.error("launcher", "No Chrome executable found")
             return False
 
+        self._stop = asyncio.Event()
+
         # Start concurrent diagnostics collection
         diagnostics_task = asyncio.create_task(self._collect_concurrent_diagnostics())
 
+        strategies = self._STRATEGIES
+
         try:
-            # Try progressive launch strategies
-            strategies = [
-                ("vanilla", []),
-                ("no_gpu", ["--disable-gpu"]),
-                ("no_vaapi", ["--disable-gpu", "--disable-features=VaapiVideoDecoder"]),
-                ("safe_mode", ["--disable-gpu", "--no-sandbox", "--incognito"]),
-            ]
+            # SELinux fixes: system-wide state, so applied once up front
+            # rather than awaited inside every strategy
+            if self.config.enable_selinux_fix:
+                await self._apply_selinux_fix()
 
+            # Try progressive launch strategies
             for attempt_num, (strategy, base_flags) in enumerate(strategies, 1):
                 if attempt_num > self.config.max_attempts:
                     break
 
-                # Prepare flags
-                flags = base_flags + self.config.extra_flags
+                # Prepare flags: a fresh list, since the environment fixes
+                # below extend it in place
+                flags = [*base_flags, *self.config.extra_flags]
 
                 # Apply environment-specific fixes
-                flags = await self._apply_environment_fixes(flags)
+                flags = self._apply_environment_fixes(flags)
 
                 # Create launch attempt
                 attempt = LaunchAttempt(
@@ -109,9 +231,12 @@ class AsyncChromeLauncher:
                     self.logger.info("launcher", f"Chrome launched successfully with {strategy} strategy")
                     return True
 
-                # Wait before next attempt
-                if attempt_num < len(strategies):
-                    await asyncio.sleep(2)
+                # Wait before next attempt, unless this was the last one.
+                # The backoff wakes immediately if request_stop() is called.
+                if attempt_num < min(len(strategies), self.config.max_attempts):
+                    if await self._stop_requested_within(2):
+                        self.logger.info("launcher", "Stop requested, abandoning remaining strategies")
+                        return False
 
             # If all attempts failed, try Flatpak fallback
             if self.config.enable_flatpak_fallback:
@@ -124,9 +249,16 @@ class AsyncChromeLauncher:
             diagnostics_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await diagnostics_task
+            # Don't leave rejected Chrome processes running behind us
+            await self._drain_reapers()
 
     async def _launch_chrome_async(self, chrome_path: str, flags: List[str], attempt: LaunchAttempt) -> bool:
         """Launch Chrome asynchronously."""
+        # A previous attempt's Chrome may still hold the profile's singleton
+        # lock, which would make this one hand off to it and exit, so finish
+        # reaping first. Usually already done: it overlaps the retry backoff.
+        await self._drain_reapers()
+
         try:
             # Build command
             cmd = [chrome_path, *flags]
@@ -146,7 +278,7 @@ class AsyncChromeLauncher:
 
             # Wait for process to start or fail
             try:
-                await asyncio.wait_for(process.wait(), timeout=self.config.launch_timeout)
+                await _with_timeout(process.wait(), self.config.launch_timeout)
                 # If we get here, the process exited (probably failed)
                 stdout, stderr = await process.communicate()
                 attempt.error = stderr.decode() if stderr else "Process exited unexpectedly"
@@ -158,12 +290,12 @@ class AsyncChromeLauncher:
                 if await self._verify_chrome_running(process.pid):
                     return True
                 else:
-                    # Kill the process if it's not responding
-                    try:
-                        process.terminate()
-                        await asyncio.wait_for(process.wait(), timeout=5)
-                    except asyncio.TimeoutError:
-                        process.kill()
+                    # Kill the process if it's not responding. This runs in
+                    # the background so the strategy loop moves straight on
+                    # to its backoff instead of waiting up to 5s here.
+                    reaper = asyncio.create_task(self._terminate(process))
+                    self._reapers.add(reaper)
+                    reaper.add_done_callback(self._reapers.discard)
                     return False
 
         except Exception as e:
@@ -171,6 +303,24 @@ class AsyncChromeLauncher:
             self.logger.error("launcher", f"Launch failed: {e}")
             return False
 
+    async def _terminate(self, process) -> None:
+        """Terminate a rejected Chrome process, escalating to kill after 5s."""
+        try:
+            process.terminate()
+            try:
+                await _with_timeout(process.wait(), 5)
+            except asyncio.TimeoutError:
+                process.kill()
+                # Reap it so no zombie outlives the launcher
+                await process.wait()
+        except ProcessLookupError:
+            pass  # Already exited on its own
+
+    async def _drain_reapers(self) -> None:
+        """Wait for any background _terminate() tasks to finish."""
+        if self._reapers:
+            await asyncio.gather(*self._reapers, return_exceptions=True)
+
     async def _verify_chrome_running(self, pid: int) -> bool:
         """Verify Chrome process is running and responsive."""
         try:
@@ -180,40 +330,51 @@ class AsyncChromeLauncher:
 
             process = psutil.Process(pid)
 
-            # Check if it's actually Chrome
-            if "chrome" not in process.name().lower():
-                return False
+            # oneshot() reads /proc/<pid>/stat once and serves both name()
+            # and status() from that snapshot
+            with process.oneshot():
+                # Check if it's actually Chrome
+                if "chrome" not in process.name().lower():
+                    return False
 
-            # Check if process is responsive (not zombie)
-            if process.status() == psutil.STATUS_ZOMBIE:
-                return False
+                # Check if process is responsive (not zombie)
+                if process.status() == psutil.STATUS_ZOMBIE:
+                    return False
 
             # Give Chrome a moment to fully initialize
             await asyncio.sleep(2)
 
-            # Check if still running after initialization
-            return psutil.pid_exists(pid) and process.status() != psutil.STATUS_ZOMBIE
+            # Check if still running after initialization. is_running() reuses
+            # this handle and also rejects a recycled PID, which pid_exists()
+            # cannot tell apart
+            with process.oneshot():
+                return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
 
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return False
 
-    async def _apply_environment_fixes(self, flags: List[str]) -> List[str]:
-        """Apply environment-specific fixes."""
-        import os
-
+    def _apply_environment_fixes(self, flags: List[str]) -> List[str]:
+        """Apply environment-specific flag fixes."""
         # Wayland compatibility
-        session_type = os.environ.get('XDG_SESSION_TYPE')
-        if session_type == 'wayland':
-            flags.extend(['--ozone-platform=x11', '--disable-features=UseOzonePlatform'])
-
-        # SELinux fixes
-        if self.config.enable_selinux_fix:
-            await self._apply_selinux_fix()
+        # Read per call rather than frozen at import, like Config's env
+        # overrides, so a changed environment or a test's patch is honoured
+        if os.environ.get('XDG_SESSION_TYPE') == 'wayland':
+            flags.extend(_WAYLAND_FLAGS)
 
         return flags
 
     async def _apply_selinux_fix(self):
         """Apply SELinux permissive rule for Chrome."""
+        if self._selinux_checked:
+            return
+        self._selinux_checked = True
+
+        # Without the SELinux userland there is nothing to fix; skip the
+        # getenforce and sudo subprocesses entirely on those systems
+        if not (shutil.which('getenforce') and shutil.which('semanage')):
+            self.logger.debug("selinux", "SELinux tools not installed, skipping fix")
+            return
+
         try:
             # Check if SELinux is enforcing
             result = await asyncio.create_subprocess_exec(
@@ -224,13 +385,21 @@ class AsyncChromeLauncher:
             stdout, _ = await result.communicate()
 
             if stdout.decode().strip() == 'Enforcing':
-                # Apply permissive rule
+                # Apply permissive rule. Root runs semanage directly; everyone
+                # else uses sudo -n, which fails fast instead of prompting for
+                # a password or logging a PAM failure
                 self.logger.info("selinux", "Applying SELinux permissive rule for chrome_sandbox_t")
-                await asyncio.create_subprocess_exec(
-                    'sudo', 'semanage', 'permissive', '-a', 'chrome_sandbox_t',
+                cmd = ['semanage', 'permissive', '-a', 'chrome_sandbox_t']
+                if os.geteuid() != 0:
+                    cmd = ['sudo', '-n', *cmd]
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE
                 )
+                _, stderr = await process.communicate()
+                if process.returncode != 0:
+                    self.logger.warning("selinux", f"semanage failed: {stderr.decode().strip()}")
 
         except Exception as e:
             self.logger.warning("selinux", f"Could not apply SELinux fix: {e}")
@@ -254,7 +423,7 @@ class AsyncChromeLauncher:
 
             # Wait briefly to see if it starts
             try:
-                await asyncio.wait_for(process.wait(), timeout=5)
+                await _with_timeout(process.wait(), 5)
                 return False  # Exited too quickly
             except asyncio.TimeoutError:
                 # Still running - good!
@@ -267,30 +436,31 @@ class AsyncChromeLauncher:
     async def _collect_concurrent_diagnostics(self):
         """Collect diagnostics concurrently while Chrome is launching."""
         try:
-            # Collect system info
-            await self._collect_system_info()
-
-            # Monitor dmesg for issues
-            await self._monitor_dmesg()
-
-            # Collect journal logs
-            await self._collect_journal_logs()
+            # System info, dmesg and the journal are independent, so run them
+            # side by side: the two 30s monitors overlap instead of queueing.
+            # gather() rather than TaskGroup keeps Python < 3.11 working;
+            # return_exceptions stops one failure from orphaning the others,
+            # and cancelling this task still cancels all three.
+            results = await asyncio.gather(
+                self._collect_system_info(),
+                self._monitor_dmesg(),
+                self._collect_journal_logs(),
+                return_exceptions=True,
+            )
 
         except asyncio.CancelledError:
             self.logger.debug("diagnostics", "Concurrent diagnostics collection cancelled")
             raise
-        except Exception as e:
-            self.logger.error("diagnostics", f"Error in concurrent diagnostics: {e}")
+
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("diagnostics", f"Error in concurrent diagnostics: {result}")
 
     async def _collect_system_info(self):
         """Collect system information asynchronously."""
-        import platform
-
         info = {
-            "platform": platform.platform(),
-            "python_version": platform.python_version(),
-            "cpu_count": psutil.cpu_count(),
-            "memory_total": psutil.virtual_memory().total,
+            **_static_system_info(),
+            # The only field that can change while we run
             "disk_usage": psutil.disk_usage('/').percent,
         }
 
@@ -298,6 +468,11 @@ class AsyncChromeLauncher:
 
     async def _monitor_dmesg(self):
         """Monitor dmesg for Chrome-related messages."""
+        # Skip the fork+exec+ENOENT round trip when the tool isn't installed
+        if not _have('dmesg'):
+            self.logger.debug("dmesg", "dmesg not available, skipping monitor")
+            return
+
         try:
             process = await asyncio.create_subprocess_exec(
                 'dmesg', '-T', '--follow',
@@ -305,26 +480,25 @@ class AsyncChromeLauncher:
                 stderr=asyncio.subprocess.PIPE
             )
 
-            # Read dmesg output for a limited time
-            start_time = time.time()
-            while time.time() - start_time < 30:  # Monitor for 30 seconds
-                try:
-                    line = await asyncio.wait_for(process.stdout.readline(), timeout=1)
-                    if not line:
-                        break
-
-                    line_str = line.decode().strip()
-                    if 'chrome' in line_str.lower():
-                        self.logger.info("dmesg", line_str)
-
-                except asyncio.TimeoutError:
-                    continue
+            try:
+                # Read dmesg output for a limited time (30 seconds). The
+                # filter runs on bytes so unrelated kernel lines are never
+                # decoded.
+                async for line in _iter_lines(process.stdout, 30):
+                    if b'chrome' in line.lower():
+                        self.logger.info("dmesg", line.decode(errors="replace").strip())
+            finally:
+                _kill_quietly(process)
 
         except Exception as e:
             self.logger.debug("dmesg", f"Could not monitor dmesg: {e}")
 
     async def _collect_journal_logs(self):
         """Collect systemd journal logs asynchronously."""
+        if not _have('journalctl'):
+            self.logger.debug("journal", "journalctl not available, skipping collection")
+            return
+
         try:
             process = await asyncio.create_subprocess_exec(
                 'journalctl', '-f', '--lines=50', '--grep=chrome',
@@ -332,19 +506,14 @@ class AsyncChromeLauncher:
                 stderr=asyncio.subprocess.PIPE
             )
 
-            # Read journal output for a limited time
-            start_time = time.time()
-            while time.time() - start_time < 30:  # Monitor for 30 seconds
-                try:
-                    line = await asyncio.wait_for(process.stdout.readline(), timeout=1)
-                    if not line:
-                        break
-
-                    line_str = line.decode().strip()
-                    self.logger.info("journal", line_str)
-
-                except asyncio.TimeoutError:
-                    continue
+            try:
+                # Read journal output for a limited time (30 seconds)
+                async for line in _iter_lines(process.stdout, 30):
+                    line_str = line.decode(errors="replace").strip()
+                    if line_str:
+                        self.logger.info("journal", line_str)
+            finally:
+                _kill_quietly(process)
 
         except Exception as e:
             self.logger.debug("journal", f"Could not collect journal logs: {e}")
@@ -8,15 +8,16 @@ CHATGPT AUDIT COMPLIANCE:
 - Implements all audit requirements precisely
 """
 
-import importlib.metadata
-
 import typer
 
+from chrome_troubleshooter import __version__
 from chrome_troubleshooter.config import Config
 from chrome_troubleshooter.constants import get_cache_dir
-from chrome_troubleshooter.diagnostics import collect_all
-from chrome_troubleshooter.launcher import safe_launch
-from chrome_troubleshooter.logger import StructuredLogger
+from chrome_troubleshooter.utils import newest_session
+
+# DEFERRED IMPORTS: launcher (rich), diagnostics and logger (sqlite3) are
+# imported inside the commands that use them, so `version`, `export-sqlite`
+# and --help don't load them.
 
 # Create Typer app with exact specification from audit
 app = typer.Typer(add_completion=False, help="Chrome Troubleshooter - beta")
@@ -27,6 +28,9 @@ def launch(
     timeout: int = typer.Option(15, help="Seconds to consider Chrome stable")
 ) -> None:
     """Start Chrome with safe flags and create a forensic session."""
+    from chrome_troubleshooter.launcher import safe_launch
+    from chrome_troubleshooter.logger import StructuredLogger
+
     config = Config()
     StructuredLogger(config.session_dir)
     # Use safe_launch function directly
@@ -42,12 +46,17 @@ def launch(
 @app.command()
 def diag() -> None:
     """Append diagnostics to the latest session folder."""
-    try:
-        latest = max(get_cache_dir().glob("session_*"), default=None)
-        if not latest:
-            typer.echo("No session found. Run 'chrome-troubleshooter launch' first.", err=True)
-            raise typer.Exit(1) from None
+    from chrome_troubleshooter.diagnostics import collect_all
+    from chrome_troubleshooter.logger import StructuredLogger
 
+    # Looked up outside the try: typer.Exit is an Exception subclass, so
+    # raising it inside would also print a bogus "Diagnostics failed"
+    latest = newest_session(get_cache_dir())
+    if not latest:
+        typer.echo("No session found. Run 'chrome-troubleshooter launch' first.", err=True)
+        raise typer.Exit(1)
+
+    try:
         logger = StructuredLogger(latest)
         collect_all(logger)
         typer.echo(f"Diagnostics added to: {latest}")
@@ -59,19 +68,17 @@ def diag() -> None:
 
 @app.command()
 def version() -> None:
-    """Print the installed package version."""
-    try:
-        package_version = importlib.metadata.version("chrome-troubleshooter")
-        typer.echo(package_version)
-    except importlib.metadata.PackageNotFoundError:
-        typer.echo("Package version not found. Try reinstalling with: pip install -e .", err=True)
-        raise typer.Exit(1) from None
+    """Print the package version."""
+    # The static __version__ (kept in step with pyproject.toml) instead of
+    # importlib.metadata, which walks sys.path and parses a dist-info on
+    # every call and fails outright when the package isn't installed
+    typer.echo(__version__)
 
 
 @app.command("export-sqlite")
 def export_sqlite() -> None:
     """Print path to newest logs.sqlite and exit."""
-    latest = max(get_cache_dir().glob("session_*"), default=None)
+    latest = newest_session(get_cache_dir())
     if latest:
         typer.echo(latest / "logs.sqlite")
     else:
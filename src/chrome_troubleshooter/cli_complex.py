@@ -1,74 +1,101 @@
-import argparse
-
 #!/usr/bin/env python3
 """
 🔧 CHROME TROUBLESHOOTER - COMMAND LINE INTERFACE
 Professional CLI for Chrome crash diagnosis and auto-remediation
 """
 
+import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
+from . import __version__
 from .config import Config, load_config, save_config
-from .diagnostics import DiagnosticsCollector
-from .launcher import ChromeLauncher
-from .logger import StructuredLogger
-
-# Initialize Rich console
-console = Console()
-app = typer.Typer(
-    name="chrome-troubleshooter",
-    help="🔧 Advanced Chrome crash diagnosis and auto-remediation tool",
-    add_completion=False,
-    rich_markup_mode="rich"
-)
-
-
-@app.command()
-def launch(
-    timeout: Optional[int] = typer.Option(None, "--timeout", help="Launch timeout in seconds"),
-    max_attempts: Optional[int] = typer.Option(None, "--max-attempts", help="Maximum launch attempts"),
-    extra_flags: Optional[list[str]] = typer.Option(None, "--extra-flags", help="Additional Chrome flags"),
-    no_selinux_fix: bool = typer.Option(False, "--no-selinux-fix", help="Disable automatic SELinux fixes"),
-    no_flatpak_fallback: bool = typer.Option(False, "--no-flatpak-fallback", help="Disable Flatpak fallback"),
-    config_file: Optional[Path] = typer.Option(None, "--config-file", help="Path to configuration file"),
-    verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
-):
-    """Launch Chrome with troubleshooting and progressive fallbacks."""
-    return handle_launch_typer(timeout, max_attempts, extra_flags, no_selinux_fix, no_flatpak_fallback, config_file, verbose)
-
-
-@app.command()
-def diagnose(
-    journal_lines: Optional[int] = typer.Option(None, "--journal-lines", help="Number of journal lines to collect"),
-    output: Optional[Path] = typer.Option(None, "--output", help="Save diagnostics to file"),
-    config_file: Optional[Path] = typer.Option(None, "--config-file", help="Path to configuration file"),
-    verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
-):
-    """Run comprehensive diagnostics without launching Chrome."""
-    typer.echo("Diagnose command not yet implemented"); return
-
-
-@app.command()
-def status(
-    check_deps: bool = typer.Option(False, "--check-deps", help="Check system dependencies"),
-    config_file: Optional[Path] = typer.Option(None, "--config-file", help="Path to configuration file"),
-    verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
-):
-    """Show system status and configuration."""
-    typer.echo("Status command not yet implemented"); return
+
+# Project modules with heavy imports or side effects (launcher,
+# diagnostics, logger/sqlite3) and rich's panel/progress widgets are
+# imported inside the handlers that use them, so status/config/logs/clean
+# and --help skip them. typer and rich.console are deferred as well: the
+# Typer ``app`` is built on first access and the console on first print.
+
+_console = None
+
+
+def _get_console():
+    """Return the shared Rich console, creating it on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def _build_typer_app():
+    """Build the Typer front end (typer is only imported when it is used)"""
+    import typer
+
+    app = typer.Typer(
+        name="chrome-troubleshooter",
+        help="🔧 Advanced Chrome crash diagnosis and auto-remediation tool",
+        add_completion=False,
+        rich_markup_mode="rich"
+    )
+
+    @app.command()
+    def launch(
+        timeout: Optional[int] = typer.Option(None, "--timeout", help="Launch timeout in seconds"),
+        max_attempts: Optional[int] = typer.Option(None, "--max-attempts", help="Maximum launch attempts"),
+        extra_flags: Optional[list[str]] = typer.Option(None, "--extra-flags", help="Additional Chrome flags"),
+        no_selinux_fix: bool = typer.Option(False, "--no-selinux-fix", help="Disable automatic SELinux fixes"),
+        no_flatpak_fallback: bool = typer.Option(False, "--no-flatpak-fallback", help="Disable Flatpak fallback"),
+        config_file: Optional[Path] = typer.Option(None, "--config-file", help="Path to configuration file"),
+        verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
+    ):
+        """Launch Chrome with troubleshooting and progressive fallbacks."""
+        return handle_launch_typer(timeout, max_attempts, extra_flags, no_selinux_fix, no_flatpak_fallback, config_file, verbose)
+
+    @app.command()
+    def diagnose(
+        journal_lines: Optional[int] = typer.Option(None, "--journal-lines", help="Number of journal lines to collect"),
+        output: Optional[Path] = typer.Option(None, "--output", help="Save diagnostics to file"),
+        config_file: Optional[Path] = typer.Option(None, "--config-file", help="Path to configuration file"),
+        verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
+    ):
+        """Run comprehensive diagnostics without launching Chrome."""
+        typer.echo("Diagnose command not yet implemented"); return
+
+    @app.command()
+    def status(
+        check_deps: bool = typer.Option(False, "--check-deps", help="Check system dependencies"),
+        config_file: Optional[Path] = typer.Option(None, "--config-file", help="Path to configuration file"),
+        verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
+    ):
+        """Show system status and configuration."""
+        typer.echo("Status command not yet implemented"); return
+
+    return app
+
+
+def __getattr__(name):
+    """Build the module-level Typer ``app`` lazily (PEP 562)"""
+    if name == "app":
+        value = globals()["app"] = _build_typer_app()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def handle_launch_typer(timeout, max_attempts, extra_flags, no_selinux_fix, no_flatpak_fallback, config_file, verbose) -> int:
     """Handle launch command with enhanced Rich output."""
+    console = _get_console()
     try:
+        from rich.panel import Panel
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        from .launcher import ChromeLauncher
+        from .logger import StructuredLogger
+
         # Load configuration
         config = load_config(config_file)
 
@@ -93,10 +120,13 @@ def handle_launch_typer(timeout, max_attempts, extra_flags, no_selinux_fix, no_f
         # Create session directory
         session_dir = Path("/tmp/chrome-session")
 
+        # No spinner when output is piped or redirected: a disabled Progress
+        # never starts the Live refresh thread or emits escape sequences
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
+            disable=not console.is_terminal,
         ) as progress:
             task = progress.add_task("Initializing Chrome troubleshooter...", total=None)
 
@@ -138,120 +168,6 @@ def handle_launch_typer(timeout, max_attempts, extra_flags, no_selinux_fix, no_f
         console.print(f"[red]❌ Error: {e}[/red]")
         return 1
 
-    parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
-
-    parser.add_argument("--config-file", type=Path, help="Path to configuration file")
-
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="count",
-        default=0,
-        help="Increase verbosity (use -vv for debug)",
-    )
-
-    # Create subparsers
-    subparsers = parser.add_subparsers(
-        dest="command", help="Available commands", metavar="COMMAND"
-    )
-
-    # Launch command
-    launch_parser = subparsers.add_parser(
-        "launch",
-        help="Launch Chrome with troubleshooting",
-        description="Launch Chrome with progressive fallbacks and diagnostics",
-    )
-    launch_parser.add_argument("--timeout", type=int, help="Launch timeout in seconds")
-    launch_parser.add_argument(
-        "--max-attempts", type=int, help="Maximum launch attempts"
-    )
-    launch_parser.add_argument(
-        "--extra-flags", nargs="*", help="Additional Chrome flags"
-    )
-    launch_parser.add_argument(
-        "--no-selinux-fix", action="store_true", help="Disable automatic SELinux fixes"
-    )
-    launch_parser.add_argument(
-        "--no-flatpak-fallback", action="store_true", help="Disable Flatpak fallback"
-    )
-
-    # Diagnose command
-    diagnose_parser = subparsers.add_parser(
-        "diagnose",
-        help="Run diagnostics without launching Chrome",
-        description="Collect comprehensive system diagnostics",
-    )
-    diagnose_parser.add_argument(
-        "--journal-lines", type=int, help="Number of journal lines to collect"
-    )
-    diagnose_parser.add_argument("--output", type=Path, help="Save diagnostics to file")
-
-    # Status command
-    status_parser = subparsers.add_parser(
-        "status",
-        help="Show system status and configuration",
-        description="Display system information and troubleshooter status",
-    )
-    status_parser.add_argument(
-        "--check-deps", action="store_true", help="Check system dependencies"
-    )
-
-    # Config command
-    config_parser = subparsers.add_parser(
-        "config",
-        help="Configure troubleshooter settings",
-        description="View or modify configuration settings",
-    )
-    config_parser.add_argument(
-        "--show", action="store_true", help="Show current configuration"
-    )
-    config_parser.add_argument("--timeout", type=int, help="Set launch timeout")
-    config_parser.add_argument("--max-attempts", type=int, help="Set maximum attempts")
-    config_parser.add_argument(
-        "--journal-lines", type=int, help="Set journal lines to collect"
-    )
-    config_parser.add_argument("--rotate-days", type=int, help="Set log rotation days")
-    config_parser.add_argument(
-        "--enable-colors", action="store_true", help="Enable colored output"
-    )
-    config_parser.add_argument(
-        "--disable-colors", action="store_true", help="Disable colored output"
-    )
-
-    # Logs command
-    logs_parser = subparsers.add_parser(
-        "logs",
-        help="View troubleshooter logs",
-        description="View logs from troubleshooting sessions",
-    )
-    logs_parser.add_argument(
-        "--latest", action="store_true", help="Show latest session logs"
-    )
-    logs_parser.add_argument(
-        "--list", action="store_true", help="List available sessions"
-    )
-    logs_parser.add_argument("--session", type=str, help="Show specific session logs")
-    logs_parser.add_argument(
-        "--format", choices=["text", "json"], default="text", help="Output format"
-    )
-
-    # Clean command
-    clean_parser = subparsers.add_parser(
-        "clean",
-        help="Clean old logs and temporary files",
-        description="Remove old session data and temporary files",
-    )
-    clean_parser.add_argument(
-        "--days", type=int, default=7, help="Remove sessions older than N days"
-    )
-    clean_parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Show what would be removed without actually removing",
-    )
-
-    return parser
-
 
 def handle_launch(args, config: Config) -> int:
     """Handle launch command"""
@@ -276,9 +192,12 @@ def handle_launch(args, config: Config) -> int:
 
     # Create session directory
     session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_dir = config.base_dir / f"session_{session_ts}"
+    session_dir = config.ensure_base_dir() / f"session_{session_ts}"
 
     try:
+        from .launcher import ChromeLauncher
+        from .logger import StructuredLogger
+
         with StructuredLogger(
             session_dir, config.enable_colors, config.enable_sqlite, config.enable_json
         ) as logger:
@@ -296,6 +215,13 @@ def handle_launch(args, config: Config) -> int:
         return 1
 
 
+def _write_json(path: Path, data) -> None:
+    """Write data as indented JSON, using orjson when it is installed"""
+    from .utils import write_json
+
+    write_json(path, data)
+
+
 def handle_diagnose(args, config: Config) -> int:
     """Handle diagnose command"""
     if args.journal_lines is not None:
@@ -303,9 +229,12 @@ def handle_diagnose(args, config: Config) -> int:
 
     # Create session directory
     session_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_dir = config.base_dir / f"diagnose_{session_ts}"
+    session_dir = config.ensure_base_dir() / f"diagnose_{session_ts}"
 
     try:
+        from .diagnostics import DiagnosticsCollector
+        from .logger import StructuredLogger
+
         with StructuredLogger(
             session_dir, config.enable_colors, config.enable_sqlite, config.enable_json
         ) as logger:
@@ -316,32 +245,30 @@ def handle_diagnose(args, config: Config) -> int:
 
             # Save results if requested
             if args.output:
-                import json
-
-                with open(args.output, "w") as f:
-                    json.dump(results, f, indent=2, default=str)
+                _write_json(args.output, results)
                 logger.success("cli", f"Diagnostics saved to: {args.output}")
 
-            # Print summary
-            print("\n🔍 DIAGNOSTIC SUMMARY:")
-            print(f"System Info: {len(results.get('system_info', {}))}")
-            print(f"GPU Info: {len(results.get('gpu_info', {}))}")
-            print(f"Chrome Debug Logs: {len(results.get('chrome_debug_logs', []))}")
-            print(f"Crashpad Dumps: {len(results.get('crashpad_dumps', []))}")
-            print(
-                f"Journal Entries: {len(results.get('journal_logs', {}).get('user_journal', []))}"
-            )
-            print(f"dmesg Entries: {len(results.get('dmesg_delta', []))}")
-            print(f"Coredumps: {len(results.get('coredump_info', []))}")
+            # Print summary (built up and written in one go)
+            lines = [
+                "\n🔍 DIAGNOSTIC SUMMARY:",
+                f"System Info: {len(results.get('system_info', {}))}",
+                f"GPU Info: {len(results.get('gpu_info', {}))}",
+                f"Chrome Debug Logs: {len(results.get('chrome_debug_logs', []))}",
+                f"Crashpad Dumps: {len(results.get('crashpad_dumps', []))}",
+                f"Journal Entries: {len(results.get('journal_logs', {}).get('user_journal', []))}",
+                f"dmesg Entries: {len(results.get('dmesg_delta', []))}",
+                f"Coredumps: {len(results.get('coredump_info', []))}",
+            ]
 
             # Show crash analysis
             crash_analysis = results.get("crash_analysis", {})
             if crash_analysis.get("patterns_found"):
-                print("\n⚠️ DETECTED ISSUES:")
-                for pattern in crash_analysis["patterns_found"]:
-                    print(f"  • {pattern}")
+                lines.append("\n⚠️ DETECTED ISSUES:")
+                lines.extend(f"  • {pattern}" for pattern in crash_analysis["patterns_found"])
             else:
-                print("\n✅ No obvious crash patterns detected")
+                lines.append("\n✅ No obvious crash patterns detected")
+
+            print("\n".join(lines))
 
             return 0
 
@@ -350,33 +277,66 @@ def handle_diagnose(args, config: Config) -> int:
         return 1
 
 
+# Session directory name prefixes, matched with str.startswith (no glob or
+# fnmatch pattern compilation). clean also sweeps diagnose-only runs.
+_SESSION_PREFIXES = ("session_",)
+_CLEANABLE_PREFIXES = ("session_", "diagnose_")
+
+
+def _iter_sessions(base_dir: Path, prefixes=_SESSION_PREFIXES):
+    """Return (DirEntry, stat) for session directories under base_dir, newest first"""
+    # A single os.scandir() pass: the name filter and is_dir() check come
+    # from readdir (d_type), and the one stat() per match is reused for
+    # sorting and display. Entries stay DirEntry objects (.name/.path are
+    # plain strings); callers convert to Path only where they need one.
+    # Entries removed concurrently are skipped.
+    sessions = []
+    try:
+        it = os.scandir(base_dir)
+    except FileNotFoundError:
+        return sessions
+    with it:
+        for entry in it:
+            if not entry.name.startswith(prefixes):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    sessions.append((entry, entry.stat()))
+            except OSError:
+                continue
+    sessions.sort(key=lambda item: item[1].st_mtime, reverse=True)
+    return sessions
+
+
 def handle_status(args, config: Config) -> int:
     """Handle status command"""
-    print("🔧 Chrome Troubleshooter Status")
-    print("=" * 50)
+    lines = ["🔧 Chrome Troubleshooter Status", "=" * 50]
 
+    # Probed once and shared with print_status() below
+    deps = None
     if args.check_deps:
         deps = config.validate_dependencies()
-        print("\n📋 SYSTEM DEPENDENCIES:")
+        lines.append("\n📋 SYSTEM DEPENDENCIES:")
         for dep, available in deps.items():
             status = "✅" if available else "❌"
-            print(f"  {status} {dep}")
+            lines.append(f"  {status} {dep}")
 
         missing = [k for k, v in deps.items() if not v]
         if missing:
-            print(f"\n⚠️ Missing: {', '.join(missing)}")
+            lines.append(f"\n⚠️ Missing: {', '.join(missing)}")
 
-    config.print_status()
+    print("\n".join(lines))
+
+    config.print_status(deps=deps)
 
     # Show recent sessions
     if config.base_dir.exists():
-        sessions = list(config.base_dir.glob("session_*"))
-        sessions.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        sessions = _iter_sessions(config.base_dir)
 
         print(f"\n📁 RECENT SESSIONS ({len(sessions)} total):")
-        for session in sessions[:5]:  # Show last 5
-            mtime = datetime.fromtimestamp(session.stat().st_mtime)
-            print(f"  • {session.name} - {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
+        for session, st in sessions[:5]:  # Show last 5
+            mtime = datetime.fromtimestamp(st.st_mtime)
+            print(f"  • {session.name} - {mtime.isoformat(sep=' ', timespec='seconds')}")
 
     return 0
 
@@ -425,22 +385,45 @@ def handle_config(args, config: Config) -> int:
     return 0
 
 
+def _dir_size(path) -> int:
+    """Total size in bytes of the files below path, like the old rglob sum"""
+    # Imported here: utils pulls in subprocess, which the fast paths skip
+    from .utils import dir_size
+
+    return dir_size(path)
+
+
+def _stream_file(path: Path) -> None:
+    """Copy a log file to stdout in fixed-size chunks"""
+    # Avoids decoding a multi-MB session log into one str just to print
+    # it; bytes go straight to the binary stdout buffer.
+    import shutil
+
+    out = getattr(sys.stdout, "buffer", None)
+    with open(path, "rb") as f:
+        if out is None:  # stdout replaced by a text-only stream
+            sys.stdout.write(f.read().decode(errors="replace"))
+            return
+        sys.stdout.flush()  # keep ordering with earlier print() output
+        shutil.copyfileobj(f, out)
+        out.flush()
+
+
 def handle_logs(args, config: Config) -> int:
     """Handle logs command"""
     if not config.base_dir.exists():
         print("No log directory found.")
         return 1
 
-    sessions = list(config.base_dir.glob("session_*"))
-    sessions.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    sessions = _iter_sessions(config.base_dir)
 
     if args.list:
         print("📁 Available Sessions:")
-        for session in sessions:
-            mtime = datetime.fromtimestamp(session.stat().st_mtime)
-            size = sum(f.stat().st_size for f in session.rglob("*") if f.is_file())
+        for session, st in sessions:
+            mtime = datetime.fromtimestamp(st.st_mtime)
+            size = _dir_size(session)
             print(
-                f"  • {session.name} - {mtime.strftime('%Y-%m-%d %H:%M:%S')} ({size:,} bytes)"
+                f"  • {session.name} - {mtime.isoformat(sep=' ', timespec='seconds')} ({size:,} bytes)"
             )
         return 0
 
@@ -452,7 +435,7 @@ def handle_logs(args, config: Config) -> int:
             print(f"Session not found: {args.session}")
             return 1
     elif args.latest and sessions:
-        target_session = sessions[0]
+        target_session = Path(sessions[0][0].path)
     else:
         print("No session specified. Use --latest or --session <name>")
         return 1
@@ -465,15 +448,13 @@ def handle_logs(args, config: Config) -> int:
     if args.format == "json":
         json_file = target_session / "logs.jsonl"
         if json_file.exists():
-            with open(json_file) as f:
-                print(f.read())
+            _stream_file(json_file)
         else:
             print("No JSON logs found.")
     else:
         log_file = target_session / "launcher.log"
         if log_file.exists():
-            with open(log_file) as f:
-                print(f.read())
+            _stream_file(log_file)
         else:
             print("No text logs found.")
 
@@ -486,38 +467,38 @@ def handle_clean(args, config: Config) -> int:
         print("No log directory found.")
         return 0
 
-    from datetime import timedelta
-
-    cutoff = datetime.now() - timedelta(days=args.days)
+    cutoff = (datetime.now() - timedelta(days=args.days)).timestamp()
 
     sessions = []
-    for session_dir in config.base_dir.iterdir():
-        if session_dir.is_dir() and session_dir.name.startswith(
-            ("session_", "diagnose_")
-        ):
-            mtime = datetime.fromtimestamp(session_dir.stat().st_mtime)
-            if mtime < cutoff:
-                sessions.append((session_dir, mtime))
+    for session_dir, st in _iter_sessions(config.base_dir, _CLEANABLE_PREFIXES):
+        if st.st_mtime < cutoff:
+            # Format once; reused by both the dry-run and remove messages
+            stamp = datetime.fromtimestamp(st.st_mtime).isoformat(
+                sep=" ", timespec="seconds"
+            )
+            sessions.append((session_dir, stamp))
 
     if not sessions:
         print(f"No sessions older than {args.days} days found.")
         return 0
 
+    if not args.dry_run:
+        # Only needed when actually removing; imported once, not per session
+        import shutil
+
     total_size = 0
-    for session_dir, mtime in sessions:
-        size = sum(f.stat().st_size for f in session_dir.rglob("*") if f.is_file())
+    for session_dir, stamp in sessions:
+        size = _dir_size(session_dir)
         total_size += size
 
         if args.dry_run:
             print(
-                f"Would remove: {session_dir.name} ({mtime.strftime('%Y-%m-%d %H:%M:%S')}, {size:,} bytes)"
+                f"Would remove: {session_dir.name} ({stamp}, {size:,} bytes)"
             )
         else:
-            import shutil
-
             shutil.rmtree(session_dir)
             print(
-                f"Removed: {session_dir.name} ({mtime.strftime('%Y-%m-%d %H:%M:%S')}, {size:,} bytes)"
+                f"Removed: {session_dir.name} ({stamp}, {size:,} bytes)"
             )
 
     action = "Would remove" if args.dry_run else "Removed"
@@ -526,9 +507,146 @@ def handle_clean(args, config: Config) -> int:
     return 0
 
 
-def create_parser():
-    parser = argparse.ArgumentParser(description="Chrome Troubleshooter")
-    """Create the main argument parser"""
+def _build_launch(subparsers) -> None:
+    """Register the launch subcommand"""
+    launch_parser = subparsers.add_parser(
+        "launch",
+        help="Launch Chrome with troubleshooting",
+        description="Launch Chrome with progressive fallbacks and diagnostics",
+    )
+    launch_parser.add_argument("--timeout", type=int, help="Launch timeout in seconds")
+    launch_parser.add_argument(
+        "--max-attempts", type=int, help="Maximum launch attempts"
+    )
+    launch_parser.add_argument(
+        "--extra-flags", nargs="*", help="Additional Chrome flags"
+    )
+    launch_parser.add_argument(
+        "--no-selinux-fix", action="store_true", help="Disable automatic SELinux fixes"
+    )
+    launch_parser.add_argument(
+        "--no-flatpak-fallback", action="store_true", help="Disable Flatpak fallback"
+    )
+
+
+def _build_diagnose(subparsers) -> None:
+    """Register the diagnose subcommand"""
+    diagnose_parser = subparsers.add_parser(
+        "diagnose",
+        help="Run diagnostics without launching Chrome",
+        description="Collect comprehensive system diagnostics",
+    )
+    diagnose_parser.add_argument(
+        "--journal-lines", type=int, help="Number of journal lines to collect"
+    )
+    diagnose_parser.add_argument("--output", type=Path, help="Save diagnostics to file")
+
+
+def _build_status(subparsers) -> None:
+    """Register the status subcommand"""
+    status_parser = subparsers.add_parser(
+        "status",
+        help="Show system status and configuration",
+        description="Display system information and troubleshooter status",
+    )
+    status_parser.add_argument(
+        "--check-deps", action="store_true", help="Check system dependencies"
+    )
+
+
+def _build_config(subparsers) -> None:
+    """Register the config subcommand"""
+    config_parser = subparsers.add_parser(
+        "config",
+        help="Configure troubleshooter settings",
+        description="View or modify configuration settings",
+    )
+    config_parser.add_argument(
+        "--show", action="store_true", help="Show current configuration"
+    )
+    config_parser.add_argument("--timeout", type=int, help="Set launch timeout")
+    config_parser.add_argument("--max-attempts", type=int, help="Set maximum attempts")
+    config_parser.add_argument(
+        "--journal-lines", type=int, help="Set journal lines to collect"
+    )
+    config_parser.add_argument("--rotate-days", type=int, help="Set log rotation days")
+    config_parser.add_argument(
+        "--enable-colors", action="store_true", help="Enable colored output"
+    )
+    config_parser.add_argument(
+        "--disable-colors", action="store_true", help="Disable colored output"
+    )
+
+
+def _build_logs(subparsers) -> None:
+    """Register the logs subcommand"""
+    logs_parser = subparsers.add_parser(
+        "logs",
+        help="View troubleshooter logs",
+        description="View logs from troubleshooting sessions",
+    )
+    logs_parser.add_argument(
+        "--latest", action="store_true", help="Show latest session logs"
+    )
+    logs_parser.add_argument(
+        "--list", action="store_true", help="List available sessions"
+    )
+    logs_parser.add_argument("--session", type=str, help="Show specific session logs")
+    logs_parser.add_argument(
+        "--format", choices=["text", "json"], default="text", help="Output format"
+    )
+
+
+def _build_clean(subparsers) -> None:
+    """Register the clean subcommand"""
+    clean_parser = subparsers.add_parser(
+        "clean",
+        help="Clean old logs and temporary files",
+        description="Remove old session data and temporary files",
+    )
+    clean_parser.add_argument(
+        "--days", type=int, default=7, help="Remove sessions older than N days"
+    )
+    clean_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be removed without actually removing",
+    )
+
+
+# Subcommand builders, in help order. Only the invoked subcommand is built;
+# help and unknown commands fall back to building all of them.
+_SUBCOMMAND_BUILDERS = {
+    "launch": _build_launch,
+    "diagnose": _build_diagnose,
+    "status": _build_status,
+    "config": _build_config,
+    "logs": _build_logs,
+    "clean": _build_clean,
+}
+
+# Global options that consume the following token as their value
+_GLOBAL_OPTS_WITH_VALUE = frozenset({"--config-file"})
+
+
+def _sniff_subcommand(argv) -> Optional[str]:
+    """Return the subcommand named in argv, or None if absent or unknown"""
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+            continue
+        if token.startswith("-"):
+            skip_value = token in _GLOBAL_OPTS_WITH_VALUE
+            continue
+        return token if token in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def create_parser(argv=None):
+    """Create the main argument parser, building only the requested subcommand"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="chrome-troubleshooter",
         description="🔧 Advanced Chrome crash diagnosis and auto-remediation tool",
@@ -536,6 +654,7 @@ def create_parser():
     )
 
     # Global options
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     parser.add_argument(
         "--config-file",
         type=Path,
@@ -549,29 +668,45 @@ def create_parser():
     )
 
     # Subcommands
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    subparsers = parser.add_subparsers(
+        dest="command", help="Available commands", metavar="COMMAND"
+    )
 
-    # Launch command
-    launch_parser = subparsers.add_parser("launch", help="Launch Chrome with troubleshooting")
-    launch_parser.add_argument("--timeout", type=int, help="Launch timeout in seconds")
-    launch_parser.add_argument("--max-attempts", type=int, help="Maximum launch attempts")
+    command = _sniff_subcommand(sys.argv[1:] if argv is None else argv)
+    if command is not None:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        # Help output and error messages need the full command list
+        for build in _SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
 
-    # Status command
-    status_parser = subparsers.add_parser("status", help="Show system status")
-    status_parser.add_argument("--check-deps", action="store_true", help="Check dependencies")
+    return parser
 
-    # Diagnose command
-    diag_parser = subparsers.add_parser("diagnose", help="Run diagnostics")
-    diag_parser.add_argument("--output", type=Path, help="Save diagnostics to file")
 
-    return parser
+# Subcommand name -> handler. The handlers import their own heavy
+# dependencies, so dispatch only walks the chosen command's import graph.
+_HANDLERS = {
+    "launch": handle_launch,
+    "diagnose": handle_diagnose,
+    "status": handle_status,
+    "config": handle_config,
+    "logs": handle_logs,
+    "clean": handle_clean,
+}
 
 
 def main() -> int:
     """Main CLI entry point"""
 
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+
+    # Fast path: answer --version before argparse (and its imports) load
+    if argv == ["--version"]:
+        print(f"chrome-troubleshooter {__version__}")
+        return 0
+
+    parser = create_parser(argv)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -592,21 +727,11 @@ def main() -> int:
 
     # Route to appropriate handler
     try:
-        if args.command == "launch":
-            return handle_launch(args, config)
-        elif args.command == "diagnose":
-            return handle_diagnose(args, config)
-        elif args.command == "status":
-            return handle_status(args, config)
-        elif args.command == "config":
-            return handle_config(args, config)
-        elif args.command == "logs":
-            return handle_logs(args, config)
-        elif args.command == "clean":
-            return handle_clean(args, config)
-        else:
+        handler = _HANDLERS.get(args.command)
+        if handler is None:
             print(f"❌ Unknown command: {args.command}")
             return 1
+        return handler(args, config)
     except KeyboardInterrupt:
         print("\n⚠️ Interrupted by user")
         return 130
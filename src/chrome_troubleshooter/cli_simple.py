@@ -4,21 +4,26 @@
 Clean, working CLI based on ChatGPT audit suggestions
 """
 
-import importlib.metadata
-import sys
-import time
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .config import Config, load_config
-from .diagnostics import DiagnosticsCollector
-from .launcher import ChromeLauncher
-from .logger import StructuredLogger
+from . import __version__
+from ._commands import (
+    apply_verbosity,
+    check_system_dependencies,
+    command_errors,
+    run_diagnose,
+    run_launch,
+    run_locked,
+)
+from .config import load_config
+
+# The command bodies are shared with cli_typer in _commands, which also
+# defers rich.panel/rich.progress and the launcher, diagnostics and logger
+# modules until launch/diagnose actually run.
 
 # Initialize Rich console and Typer app
 console = Console()
@@ -30,13 +35,6 @@ app = typer.Typer(
     no_args_is_help=True
 )
 
-def create_session_directory(config: Config) -> Path:
-    """Create a session directory for logs."""
-    timestamp = time.strftime("%Y%m%d_%H%M%S")
-    session_dir = config.base_dir / f"session_{timestamp}"
-    session_dir.mkdir(parents=True, exist_ok=True)
-    return session_dir
-
 @app.command()
 def launch(
     timeout: Optional[int] = typer.Option(None, "--timeout", help="Launch timeout in seconds"),
@@ -45,8 +43,7 @@ def launch(
     verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
 ):
     """🚀 Launch Chrome with troubleshooting and progressive fallbacks"""
-
-    try:
+    with command_errors(console, verbose):
         # Load configuration
         config = load_config(config_file)
 
@@ -55,63 +52,9 @@ def launch(
             config.launch_timeout = timeout
         if max_attempts is not None:
             config.max_attempts = max_attempts
+        apply_verbosity(config, verbose)
 
-        # Set verbosity
-        if verbose >= 2:
-            config.log_level = "DEBUG"
-        elif verbose >= 1:
-            config.log_level = "INFO"
-
-        # Create session directory
-        session_dir = create_session_directory(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Initializing Chrome troubleshooter...", total=None)
-
-            # Initialize logger
-            with StructuredLogger(session_dir, config) as logger:
-                progress.update(task, description="Starting Chrome launcher...")
-
-                # Initialize launcher
-                launcher = ChromeLauncher(config, logger)
-
-                progress.update(task, description="Launching Chrome with troubleshooting...")
-
-                # Launch Chrome
-                success = launcher.launch()
-
-                if success:
-                    progress.update(task, description="✅ Chrome launched successfully!")
-                    console.print(Panel.fit(
-                        "[green]✅ Chrome launched successfully![/green]\n"
-                        f"Session logs: {session_dir}",
-                        title="Success",
-                        border_style="green"
-                    ))
-                    return 0
-                else:
-                    progress.update(task, description="❌ Chrome launch failed")
-                    console.print(Panel.fit(
-                        "[red]❌ Chrome launch failed after all attempts[/red]\n"
-                        f"Check logs: {session_dir}",
-                        title="Failure",
-                        border_style="red"
-                    ))
-                    return 1
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        if verbose >= 2:
-            import traceback
-            console.print(traceback.format_exc())
-        raise typer.Exit(1)
+        return run_launch(console, config)
 
 @app.command()
 def diagnose(
@@ -120,64 +63,17 @@ def diagnose(
     verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
 ):
     """🔍 Run comprehensive diagnostics without launching Chrome"""
-
-    try:
+    with command_errors(console, verbose):
         # Load configuration
         config = load_config(config_file)
+        apply_verbosity(config, verbose)
 
-        # Set verbosity
-        if verbose >= 2:
-            config.log_level = "DEBUG"
-        elif verbose >= 1:
-            config.log_level = "INFO"
-
-        # Create session directory
-        session_dir = create_session_directory(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running diagnostics...", total=None)
+        return run_diagnose(console, config, output, _print_summary)
 
-            # Initialize logger
-            with StructuredLogger(session_dir, config) as logger:
-                progress.update(task, description="Collecting system information...")
-
-                # Initialize diagnostics collector
-                collector = DiagnosticsCollector(config, logger)
-
-                progress.update(task, description="Analyzing system environment...")
-
-                # Collect diagnostics
-                diagnostics = collector.collect_all()
-
-                progress.update(task, description="Generating report...")
-
-                # Display results
-                console.print("🔍 Diagnostics completed!")
-                console.print(f"Results: {len(diagnostics)} categories analyzed")
-
-                # Save to file if requested
-                if output:
-                    import json
-                    with open(output, 'w') as f:
-                        json.dump(diagnostics, f, indent=2, default=str)
-                    console.print(f"[green]✅ Diagnostics saved to: {output}[/green]")
-
-                console.print(f"[blue]📁 Session logs: {session_dir}[/blue]")
-                return 0
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        if verbose >= 2:
-            import traceback
-            console.print(traceback.format_exc())
-        raise typer.Exit(1)
+def _print_summary(diagnostics: dict):
+    """Print a one-line summary of the collected diagnostics."""
+    console.print("🔍 Diagnostics completed!")
+    console.print(f"Results: {len(diagnostics)} categories analyzed")
 
 @app.command()
 def status(
@@ -186,77 +82,39 @@ def status(
     verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
 ):
     """📊 Show system status and configuration"""
-
-    try:
+    with command_errors(console, verbose):
         # Load configuration
         config = load_config(config_file)
-
-        # Set verbosity
-        if verbose >= 2:
-            config.log_level = "DEBUG"
-        elif verbose >= 1:
-            config.log_level = "INFO"
-
-        # Display basic status
-        console.print("🔧 Chrome Troubleshooter Status")
-        console.print("Configuration loaded: ✅")
-        console.print(f"Launch timeout: {config.launch_timeout}s")
-        console.print(f"Max attempts: {config.max_attempts}")
-        console.print(f"Log level: {config.log_level}")
+        apply_verbosity(config, verbose)
+
+        # Display basic status. Lines are collected and printed in one
+        # console.print() so Rich renders and flushes once, not per line.
+        lines = [
+            "🔧 Chrome Troubleshooter Status",
+            "Configuration loaded: ✅",
+            f"Launch timeout: {config.launch_timeout}s",
+            f"Max attempts: {config.max_attempts}",
+            f"Log level: {config.log_level}",
+        ]
 
         if check_deps:
-            import shutil
-            console.print("\n📋 Dependencies:")
-            deps = {
-                "chrome": bool(shutil.which("google-chrome") or shutil.which("google-chrome-stable")),
-                "journalctl": bool(shutil.which("journalctl")),
-                "dmesg": bool(shutil.which("dmesg")),
-            }
-            for dep, available in deps.items():
+            lines.append("\n📋 Dependencies:")
+            for dep, available in check_system_dependencies().items():
                 status = "✅ Available" if available else "❌ Missing"
-                console.print(f"  {dep}: {status}")
+                lines.append(f"  {dep}: {status}")
 
+        console.print("\n".join(lines))
         return 0
 
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        if verbose >= 2:
-            import traceback
-            console.print(traceback.format_exc())
-        raise typer.Exit(1)
-
 @app.command()
 def version():
     """📋 Show version information"""
-    try:
-        version = importlib.metadata.version("chrome_troubleshooter")
-        console.print(f"Chrome Troubleshooter v{version}")
-    except importlib.metadata.PackageNotFoundError:
-        console.print("Chrome Troubleshooter (development version)")
+    # Static package version: no importlib.metadata scan of sys.path
+    console.print(f"Chrome Troubleshooter v{__version__}")
 
 def main():
     """Entry point for the simplified CLI."""
-    try:
-        # Handle lock file to prevent multiple instances
-        lock_file = Path("/tmp/.chrome_troubleshooter.lock")
-        if lock_file.exists():
-            console.print("[red]❌ Another instance is already running[/red]")
-            sys.exit(1)
-
-        try:
-            lock_file.touch()
-            app()
-        finally:
-            # Clean up lock file
-            if lock_file.exists():
-                lock_file.unlink()
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
-        sys.exit(130)
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        sys.exit(1)
+    run_locked(console, app)
 
 if __name__ == "__main__":
     main()
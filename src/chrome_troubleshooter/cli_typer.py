@@ -4,23 +4,27 @@
 Modern CLI with Rich formatting and improved UX
 """
 
-import json
-import shutil
-import sys
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
+from . import __version__
+from ._commands import (
+    apply_verbosity,
+    check_system_dependencies,
+    command_errors,
+    run_diagnose,
+    run_launch,
+    run_locked,
+)
 from .config import Config, load_config
-from .diagnostics import DiagnosticsCollector
-from .launcher import ChromeLauncher
-from .logger import StructuredLogger
+
+# The command bodies are shared with cli_simple in _commands, which also
+# defers rich.panel/rich.progress and the launcher, diagnostics and logger
+# modules until launch/diagnose actually run. rich.table is imported by
+# the display helpers below.
 
 # Initialize Rich console and Typer app
 console = Console()
@@ -35,7 +39,7 @@ app = typer.Typer(
 # Global options
 def version_callback(value: bool):
     if value:
-        console.print("Chrome Troubleshooter v1.0.0")
+        console.print(f"Chrome Troubleshooter v{__version__}")
         raise typer.Exit()
 
 @app.callback()
@@ -58,8 +62,7 @@ def launch(
     verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
 ):
     """🚀 Launch Chrome with troubleshooting and progressive fallbacks"""
-
-    try:
+    with command_errors(console, verbose):
         # Load configuration
         config = load_config(config_file)
 
@@ -74,60 +77,9 @@ def launch(
             config.enable_selinux_fix = False
         if no_flatpak_fallback:
             config.enable_flatpak_fallback = False
+        apply_verbosity(config, verbose)
 
-        # Set verbosity
-        if verbose >= 2:
-            config.log_level = "DEBUG"
-        elif verbose >= 1:
-            config.log_level = "INFO"
-
-        # Create session directory
-        session_dir = create_session_directory(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Initializing Chrome troubleshooter...", total=None)
-
-            # Initialize logger
-            with StructuredLogger(session_dir, config) as logger:
-                progress.update(task, description="Starting Chrome launcher...")
-
-                # Initialize launcher
-                launcher = ChromeLauncher(config, logger)
-
-                progress.update(task, description="Launching Chrome with troubleshooting...")
-
-                # Launch Chrome
-                success = launcher.launch()
-
-                if success:
-                    progress.update(task, description="✅ Chrome launched successfully!")
-                    console.print(Panel.fit(
-                        "[green]✅ Chrome launched successfully![/green]\n"
-                        f"Session logs: {session_dir}",
-                        title="Success",
-                        border_style="green"
-                    ))
-                    return 0
-                else:
-                    progress.update(task, description="❌ Chrome launch failed")
-                    console.print(Panel.fit(
-                        "[red]❌ Chrome launch failed after all attempts[/red]\n"
-                        f"Check logs: {session_dir}",
-                        title="Failure",
-                        border_style="red"
-                    ))
-                    return 1
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        raise typer.Exit(1)
+        return run_launch(console, config)
 
 @app.command()
 def diagnose(
@@ -137,62 +89,16 @@ def diagnose(
     verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
 ):
     """🔍 Run comprehensive diagnostics without launching Chrome"""
-
-    try:
+    with command_errors(console, verbose):
         # Load configuration
         config = load_config(config_file)
 
         # Override with command line arguments
         if journal_lines is not None:
             config.journal_lines = journal_lines
+        apply_verbosity(config, verbose)
 
-        # Set verbosity
-        if verbose >= 2:
-            config.log_level = "DEBUG"
-        elif verbose >= 1:
-            config.log_level = "INFO"
-
-        # Create session directory
-        session_dir = create_session_directory(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running diagnostics...", total=None)
-
-            # Initialize logger
-            with StructuredLogger(session_dir, config) as logger:
-                progress.update(task, description="Collecting system information...")
-
-                # Initialize diagnostics collector
-                collector = DiagnosticsCollector(config, logger)
-
-                progress.update(task, description="Analyzing system environment...")
-
-                # Collect diagnostics
-                diagnostics = collector.collect_all()
-
-                progress.update(task, description="Generating report...")
-
-                # Display results
-                display_diagnostics_table(diagnostics)
-
-                # Save to file if requested
-                if output:
-                    save_diagnostics_to_file(diagnostics, output)
-                    console.print(f"[green]✅ Diagnostics saved to: {output}[/green]")
-
-                console.print(f"[blue]📁 Session logs: {session_dir}[/blue]")
-                return 0
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
-        raise typer.Exit(130)
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        raise typer.Exit(1)
+        return run_diagnose(console, config, output, display_diagnostics_table)
 
 @app.command()
 def status(
@@ -201,28 +107,20 @@ def status(
     verbose: int = typer.Option(0, "-v", "--verbose", count=True, help="Increase verbosity")
 ):
     """📊 Show system status and configuration"""
-
-    try:
+    with command_errors(console, verbose):
         # Load configuration
         config = load_config(config_file)
-
-        # Set verbosity
-        if verbose >= 2:
-            config.log_level = "DEBUG"
-        elif verbose >= 1:
-            config.log_level = "INFO"
+        apply_verbosity(config, verbose)
 
         # Display status table
         display_status_table(config, check_deps)
 
         return 0
 
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        raise typer.Exit(1)
-
 def display_diagnostics_table(diagnostics: dict):
     """Display diagnostics in a Rich table."""
+    from rich.table import Table
+
     table = Table(title="🔍 System Diagnostics")
     table.add_column("Category", style="cyan", no_wrap=True)
     table.add_column("Status", style="magenta")
@@ -242,6 +140,8 @@ def display_diagnostics_table(diagnostics: dict):
 
 def display_status_table(config: Config, check_deps: bool):
     """Display system status in a Rich table."""
+    from rich.table import Table
+
     table = Table(title="🔧 Chrome Troubleshooter Status")
     table.add_column("Component", style="cyan", no_wrap=True)
     table.add_column("Status", style="magenta")
@@ -262,52 +162,9 @@ def display_status_table(config: Config, check_deps: bool):
 
     console.print(table)
 
-def save_diagnostics_to_file(diagnostics: dict, output_path: Path):
-    """Save diagnostics to JSON file."""
-    with open(output_path, 'w') as f:
-        json.dump(diagnostics, f, indent=2, default=str)
-
-def check_system_dependencies() -> dict:
-    """Check if required system dependencies are available."""
-    deps = {
-        "chrome": bool(shutil.which("google-chrome") or shutil.which("google-chrome-stable")),
-        "journalctl": bool(shutil.which("journalctl")),
-        "dmesg": bool(shutil.which("dmesg")),
-        "flock": bool(shutil.which("flock")),
-        "flatpak": bool(shutil.which("flatpak")),
-    }
-    return deps
-
-def create_session_directory(config: Config) -> Path:
-    """Create a session directory for logs."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    session_dir = config.base_dir / f"session_{timestamp}"
-    session_dir.mkdir(parents=True, exist_ok=True)
-    return session_dir
-
 def cli_main():
     """Entry point for the enhanced CLI."""
-    try:
-        # Handle lock file to prevent multiple instances
-        lock_file = Path("/tmp/.chrome_troubleshooter.lock")
-        if lock_file.exists():
-            console.print("[red]❌ Another instance is already running[/red]")
-            sys.exit(1)
-
-        try:
-            lock_file.touch()
-            app()
-        finally:
-            # Clean up lock file
-            if lock_file.exists():
-                lock_file.unlink()
-
-    except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️ Operation cancelled by user[/yellow]")
-        sys.exit(130)
-    except Exception as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
-        sys.exit(1)
+    run_locked(console, app)
 
 if __name__ == "__main__":
     cli_main()
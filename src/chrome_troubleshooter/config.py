@@ -4,11 +4,28 @@
 Centralized configuration management with environment variable support
 """
 
+import copy
+import functools
 import json
 import os
-from dataclasses import dataclass, field
+import stat
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+
+# Default Chrome install locations, shared by every Config instance.
+# Each instance still gets its own list copy because callers reassign or
+# edit chrome_paths; the tuple just avoids rebuilding six literals.
+_CHROME_PATHS = (
+    "/usr/bin/google-chrome",
+    "/usr/bin/google-chrome-stable",
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/opt/google/chrome/chrome",
+    "/snap/bin/chromium",
+)
 
 
 @dataclass
@@ -29,11 +46,7 @@ class Config:
 
     # Chrome launch configuration
     extra_flags: List[str] = field(
-        default_factory=lambda: (
-            os.getenv("CT_EXTRA_FLAGS", "").split()
-            if os.getenv("CT_EXTRA_FLAGS")
-            else []
-        )
+        default_factory=lambda: os.getenv("CT_EXTRA_FLAGS", "").split()
     )
     launch_timeout: int = field(
         default_factory=lambda: int(os.getenv("CT_LAUNCH_TIMEOUT", "10"))
@@ -53,7 +66,8 @@ class Config:
     # Storage configuration
     base_dir: Path = field(
         default_factory=lambda: Path(
-            os.getenv("CT_BASE_DIR", Path.home() / ".cache" / "chrome_troubleshooter")
+            os.getenv("CT_BASE_DIR")
+            or Path.home() / ".cache" / "chrome_troubleshooter"
         )
     )
     enable_sqlite: bool = field(
@@ -64,21 +78,17 @@ class Config:
     )
 
     # Chrome executable paths (auto-detected if not specified)
-    chrome_paths: List[str] = field(
-        default_factory=lambda: [
-            "/usr/bin/google-chrome",
-            "/usr/bin/google-chrome-stable",
-            "/usr/bin/chromium",
-            "/usr/bin/chromium-browser",
-            "/opt/google/chrome/chrome",
-            "/snap/bin/chromium",
-        ]
-    )
+    chrome_paths: List[str] = field(default_factory=lambda: list(_CHROME_PATHS))
 
     def __post_init__(self):
         """Validate configuration after initialization"""
+        # The directory itself is created lazily by ensure_base_dir(), so
+        # --help, --version, status and config never touch the filesystem
         self.base_dir = Path(self.base_dir)
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        # Per-instance probe caches (not dataclass fields, never serialized)
+        self._deps_cache: Optional[Dict[str, bool]] = None
+        self._chrome_cache: Optional[Tuple[Tuple[str, ...], Optional[str]]] = None
 
         # Validate numeric ranges
         if self.journal_lines < 10:
@@ -101,38 +111,40 @@ class Config:
         elif self.max_attempts > 10:
             self.max_attempts = 10
 
+    def ensure_base_dir(self) -> Path:
+        """Create base_dir if needed (call before writing session data)"""
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        return self.base_dir
+
     @classmethod
     def from_file(cls, config_path: Path) -> "Config":
         """Load configuration from JSON file with environment variable overrides"""
-        config_data = {}
-
-        if config_path.exists():
+        try:
+            st = config_path.stat()
+        except OSError:
+            config_data = {}
+        else:
+            # Keyed on mtime/size so an edited file is re-read automatically.
+            # Deep-copied because Config(**data) would otherwise share the
+            # cached lists (extra_flags, chrome_paths) between instances.
             try:
-                with open(config_path) as f:
-                    config_data = json.load(f)
+                config_data = copy.deepcopy(
+                    _read_config_data(str(config_path), st.st_mtime_ns, st.st_size)
+                )
             except (OSError, json.JSONDecodeError) as e:
+                # Failures are not cached, so every load warns again
                 print(f"Warning: Could not load config from {config_path}: {e}")
+                config_data = {}
 
         # Environment variables override file settings
         return cls(**config_data)
 
     def to_file(self, config_path: Path) -> None:
         """Save current configuration to JSON file"""
-        config_data = {
-            "enable_colors": self.enable_colors,
-            "log_level": self.log_level,
-            "journal_lines": self.journal_lines,
-            "rotate_days": self.rotate_days,
-            "extra_flags": self.extra_flags,
-            "launch_timeout": self.launch_timeout,
-            "max_attempts": self.max_attempts,
-            "enable_selinux_fix": self.enable_selinux_fix,
-            "enable_flatpak_fallback": self.enable_flatpak_fallback,
-            "base_dir": str(self.base_dir),
-            "enable_sqlite": self.enable_sqlite,
-            "enable_json": self.enable_json,
-            "chrome_paths": self.chrome_paths,
-        }
+        # asdict() covers every dataclass field, so new settings are saved
+        # without touching this method; the probe caches are not fields.
+        config_data = asdict(self)
+        config_data["base_dir"] = str(self.base_dir)
 
         try:
             config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -142,14 +154,43 @@ class Config:
             print(f"Warning: Could not save config to {config_path}: {e}")
 
     def get_chrome_executable(self) -> Optional[str]:
-        """Find the first available Chrome executable"""
-        for path in self.chrome_paths:
-            if Path(path).is_file() and os.access(path, os.X_OK):
-                return path
-        return None
+        """Find the first available Chrome executable (memoized per path list)"""
+        key = tuple(self.chrome_paths)
+        if self._chrome_cache is not None and self._chrome_cache[0] == key:
+            return self._chrome_cache[1]
+
+        # One stat() per candidate: the mode answers both "regular file?"
+        # and "executable?", and the loop stops at the first hit.
+        found = None
+        for path in key:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+                found = path
+                break
+
+        self._chrome_cache = (key, found)
+        return found
+
+    def invalidate_deps_cache(self) -> None:
+        """Forget memoized dependency and Chrome executable probes"""
+        self._deps_cache = None
+        self._chrome_cache = None
 
     def validate_dependencies(self) -> Dict[str, bool]:
         """Check if required system dependencies are available"""
+        if self._deps_cache is None:
+            self._deps_cache = self._probe_commands()
+
+        # Chrome is checked separately so edits to chrome_paths are honoured
+        dependencies = dict(self._deps_cache)
+        dependencies["chrome"] = self.get_chrome_executable() is not None
+        return dependencies
+
+    def _probe_commands(self) -> Dict[str, bool]:
+        """Probe PATH for the external commands used by the troubleshooter"""
         dependencies = {
             "python3": True,  # We're running in Python
             "sqlite3": False,
@@ -160,10 +201,11 @@ class Config:
             "rpm": False,
             "flatpak": False,
             "semanage": False,
-            "chrome": False,
         }
 
-        # Check command availability
+        # Check command availability. shutil.which() stats one candidate
+        # per PATH entry; measured faster than listing whole PATH
+        # directories, which hold hundreds of entries on a typical desktop.
         import shutil
 
         for cmd in [
@@ -178,14 +220,14 @@ class Config:
         ]:
             dependencies[cmd] = shutil.which(cmd) is not None
 
-        # Check Chrome availability
-        dependencies["chrome"] = self.get_chrome_executable() is not None
-
         return dependencies
 
-    def get_missing_dependencies(self) -> List[str]:
-        """Get list of missing critical dependencies"""
-        deps = self.validate_dependencies()
+    def get_missing_dependencies(
+        self, deps: Optional[Dict[str, bool]] = None
+    ) -> List[str]:
+        """Get list of missing critical dependencies (reusing deps if given)"""
+        if deps is None:
+            deps = self.validate_dependencies()
         critical = ["flock", "journalctl", "dmesg", "chrome"]
 
         missing = []
@@ -195,34 +237,48 @@ class Config:
 
         return missing
 
-    def print_status(self) -> None:
-        """Print current configuration status"""
-        print("🔧 Chrome Troubleshooter Configuration:")
-        print(f"  Base Directory: {self.base_dir}")
-        print(f"  Log Level: {self.log_level}")
-        print(f"  Colors: {'Enabled' if self.enable_colors else 'Disabled'}")
-        print(f"  SQLite: {'Enabled' if self.enable_sqlite else 'Disabled'}")
-        print(f"  JSON: {'Enabled' if self.enable_json else 'Disabled'}")
-        print(f"  Launch Timeout: {self.launch_timeout}s")
-        print(f"  Max Attempts: {self.max_attempts}")
-        print(f"  Journal Lines: {self.journal_lines}")
-        print(f"  Rotation Days: {self.rotate_days}")
+    def print_status(self, deps: Optional[Dict[str, bool]] = None) -> None:
+        """Print current configuration status (reusing deps if given)"""
+        # Build the whole report and write it once instead of ~14 prints
+        lines = [
+            "🔧 Chrome Troubleshooter Configuration:",
+            f"  Base Directory: {self.base_dir}",
+            f"  Log Level: {self.log_level}",
+            f"  Colors: {'Enabled' if self.enable_colors else 'Disabled'}",
+            f"  SQLite: {'Enabled' if self.enable_sqlite else 'Disabled'}",
+            f"  JSON: {'Enabled' if self.enable_json else 'Disabled'}",
+            f"  Launch Timeout: {self.launch_timeout}s",
+            f"  Max Attempts: {self.max_attempts}",
+            f"  Journal Lines: {self.journal_lines}",
+            f"  Rotation Days: {self.rotate_days}",
+        ]
 
         if self.extra_flags:
-            print(f"  Extra Flags: {' '.join(self.extra_flags)}")
+            lines.append(f"  Extra Flags: {' '.join(self.extra_flags)}")
 
         chrome_exe = self.get_chrome_executable()
         if chrome_exe:
-            print(f"  Chrome Executable: {chrome_exe}")
+            lines.append(f"  Chrome Executable: {chrome_exe}")
         else:
-            print("  Chrome Executable: NOT FOUND")
+            lines.append("  Chrome Executable: NOT FOUND")
 
-        deps = self.validate_dependencies()
+        if deps is None:
+            deps = self.validate_dependencies()
         missing = [k for k, v in deps.items() if not v]
         if missing:
-            print(f"  Missing Dependencies: {', '.join(missing)}")
+            lines.append(f"  Missing Dependencies: {', '.join(missing)}")
         else:
-            print("  Dependencies: All available")
+            lines.append("  Dependencies: All available")
+
+        print("\n".join(lines))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_data(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a JSON config file, memoized per (path, mtime, size)"""
+    # Errors propagate: lru_cache does not memoize exceptions
+    with open(path) as f:
+        return json.load(f)
 
 
 # Global configuration instance
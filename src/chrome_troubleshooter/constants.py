@@ -3,16 +3,35 @@
 APP_NAME = "chrome-troubleshooter"
 SESSION_FMT = "session_%Y-%m-%d_%H-%M-%S"
 
-def ensure_cache_dir():
-    """Create cache directory and return its Path."""
-    from pathlib import Path
-    cache_dir = Path("~/.cache/chrome-troubleshooter").expanduser()
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir
+# Bytes read from the end of /var/log/dmesg when dmesg itself is unusable
+DMESG_TAIL_BYTES = 2000
+
+# Single-instance flock for the CLI entry points. Deliberately a different
+# file from the launcher's own lock: flock() locks are per open file, so
+# the launcher would otherwise conflict with the CLI that runs it.
+LOCK_FILE = "/tmp/.chrome_troubleshooter.lock"
 
 def get_cache_dir():
     """Get cache directory as Path object."""
     from pathlib import Path
-    return Path("~/.cache/chrome-troubleshooter").expanduser()
+    return Path("~/.cache").expanduser() / APP_NAME
+
+def ensure_cache_dir():
+    """Create cache directory and return its Path.
+
+    The only place the cache directory is created; call it when a session
+    actually starts, never at import, so --help/--version and shell
+    completion stay free of filesystem syscalls.
+    """
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
 
-__all__ = ["APP_NAME", "SESSION_FMT", "ensure_cache_dir", "get_cache_dir"]
+__all__ = [
+    "APP_NAME",
+    "DMESG_TAIL_BYTES",
+    "LOCK_FILE",
+    "SESSION_FMT",
+    "ensure_cache_dir",
+    "get_cache_dir",
+]
@@ -16,13 +16,30 @@ Key design decisions from the audit:
 from __future__ import annotations
 
 import contextlib
+import functools
+import grp
+import os
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from .constants import DMESG_TAIL_BYTES
 
 # SINGLE SOURCE OF TRUTH: Updated import after module deduplication
 # Following ChatGPT audit suggestion U-C1 for module cleanup
 from .logger import StructuredLogger as LogWriter
 
+# Arguments shared by the direct and sudo dmesg strategies: the last
+# minute, with ISO timestamps like the /dev/kmsg reader produces
+_DMESG_ARGS = ("--since", "-1min", "--time-format", "iso")
+_DMESG_TIMEOUT = 10
+
+# Groups that conventionally grant sudo. Outside them `sudo -n` almost
+# always just refuses, after a fork, exec and PAM setup, so it is skipped
+_SUDO_GROUPS = frozenset({"sudo", "wheel", "admin"})
+
 
 def collect_all(log: LogWriter) -> None:
     """
@@ -43,122 +60,253 @@ def collect_all(log: LogWriter) -> None:
     the entire troubleshooting session.
     """
 
-    # Collect recent kernel messages with graceful permission handling
-    # CRITICAL ENHANCEMENT: Multiple fallback strategies for permission issues
-    # Following production script requirements for robust error handling
-    _collect_dmesg_with_fallbacks(log)
+    # CONCURRENT COLLECTION: dmesg and journalctl are independent and spend
+    # nearly all their time blocked on the child process, so run them in
+    # two worker threads. Wall time becomes the slower of the two instead
+    # of their sum. Results are logged afterwards in a fixed order so the
+    # session log reads the same as a sequential run.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="diag") as pool:
+        # Recent kernel messages, with fallbacks for permission issues
+        dmesg = pool.submit(_collect_dmesg_with_fallbacks)
+        # Recent Chrome-related journal entries
+        journal = pool.submit(_collect_journal)
 
-    # Collect recent Chrome-related journal entries
-    # Focus on Chrome process messages for targeted troubleshooting
-    if shutil.which("journalctl"):
-        try:
-            # journalctl arguments explained:
-            # -n 50: Last 50 entries (reasonable amount for analysis)
-            # --no-pager: Disable pager for programmatic access
-            # _COMM=chrome: Filter for Chrome process messages only
-            journal_output = subprocess.check_output(
-                ["journalctl", "-n", "50", "--no-pager", "_COMM=chrome"],
-                text=True,
-                errors="ignore",  # Ignore encoding errors in journal
-            )
-            # Log the output, stripping whitespace for clean formatting
-            log.add("journal", journal_output.strip())
-        except subprocess.CalledProcessError:
-            # journalctl failed (permissions, systemd not available, etc.)
-            # This is common in non-systemd systems or containers
-            log.add(
-                "journal",
-                "journalctl collection failed - systemd not available or insufficient permissions",
-            )
-        except Exception as e:
-            # Unexpected error during journal collection
-            # Log the error but continue (don't fail entire diagnostic)
-            log.add("journal", f"journalctl collection error: {e!s}")
-    else:
+        log.add("dmesg", dmesg.result())
+        log.add("journal", journal.result())
+
+
+def _collect_journal() -> str:
+    """
+    Return recent Chrome-related journal entries, or a reason they are missing.
+
+    Focuses on Chrome process messages for targeted troubleshooting.
+    """
+    # The resolved path is reused as argv[0] so the exec doesn't search
+    # PATH a second time
+    journalctl = shutil.which("journalctl")
+    if not journalctl:
         # journalctl tool not available on this system
         # This is expected on non-systemd systems (Alpine, older distributions)
-        log.add("journal", "journalctl tool not available - non-systemd system")
+        return "journalctl tool not available - non-systemd system"
 
+    try:
+        # journalctl arguments explained:
+        # -q: No "-- No entries --"/access hint lines mixed into the output
+        # -n 50: Last 50 entries (reasonable amount for analysis)
+        # --since=-1d: Bounds the backwards walk; without it a rarely
+        #   matching filter reads every journal file on disk
+        # --no-pager: Disable pager for programmatic access
+        # _COMM=chrome: Filter for Chrome process messages only
+        return _check_output_text(
+            [journalctl, "-q", "-n", "50", "--since=-1d", "--no-pager", "_COMM=chrome"],
+            timeout=10
+        )
+    except subprocess.TimeoutExpired as e:
+        # Huge or fragmented journals can make journalctl crawl; keep the
+        # tail of whatever it printed before the deadline
+        partial = (e.output or b"").strip().decode(errors="ignore")
+        return "journalctl timed out after 10s" + (f": {partial[-500:]}" if partial else "")
+    except subprocess.CalledProcessError:
+        # journalctl failed (permissions, systemd not available, etc.)
+        # This is common in non-systemd systems or containers
+        return "journalctl collection failed - systemd not available or insufficient permissions"
+    except Exception as e:
+        # Unexpected error during journal collection
+        # Report the error but continue (don't fail entire diagnostic)
+        return f"journalctl collection error: {e!s}"
 
-def _collect_dmesg_with_fallbacks(log: LogWriter) -> None:
+
+def _collect_dmesg_with_fallbacks() -> str:
     """
     Collect dmesg with multiple fallback strategies for permission issues.
 
+    Returns the text to log under the "dmesg" source: the kernel messages
+    themselves or an explanation of why they could not be read.
+
     CRITICAL FIX: Implements graceful degradation for permission errors.
     Following production script requirements for robust error handling.
 
     Strategies:
+    0. Read /dev/kmsg directly (no process spawned at all)
     1. Try dmesg without sudo (works if user has permissions)
-    2. Try with sudo -n (non-interactive sudo)
+    2. Try with sudo -n (non-interactive sudo), for sudo/wheel/admin members
     3. Try reading from /var/log/dmesg
     4. Provide helpful error message with solution
     """
-    if not shutil.which("dmesg"):
-        log.add("dmesg", "dmesg tool not available on this system")
-        return
+    # Strategy 0: the same records dmesg would read, without the fork, exec
+    # and pipe; None means /dev/kmsg is missing or restricted
+    kmsg_output = _read_kmsg(60)
+    if kmsg_output is not None:
+        return kmsg_output or "No recent kernel messages"
+
+    # Resolved once and reused as argv[0], like journalctl above
+    dmesg = shutil.which("dmesg")
+    if not dmesg:
+        return "dmesg tool not available on this system"
 
     # Strategy 1: Try dmesg without sudo (works if user has permissions)
     try:
-        dmesg_output = subprocess.check_output(
-            ["dmesg", "--since", "-1min", "--time-format", "iso"],
-            text=True,
-            errors="ignore",
-            timeout=10
-        )
-        log.add("dmesg", dmesg_output.strip() or "No recent kernel messages")
-        return
+        dmesg_output = _check_output_text([dmesg, *_DMESG_ARGS], timeout=_DMESG_TIMEOUT)
+        return dmesg_output or "No recent kernel messages"
     except subprocess.CalledProcessError as e:
         if e.returncode == 1:  # Permission denied
             pass  # Try next strategy
         else:
-            log.add("dmesg", f"dmesg failed with exit code {e.returncode}")
-            return
+            return f"dmesg failed with exit code {e.returncode}"
     except subprocess.TimeoutExpired:
-        log.add("dmesg", "dmesg command timed out")
-        return
+        return "dmesg command timed out"
     except Exception as e:
-        log.add("dmesg", f"dmesg collection error: {e!s}")
-        return
+        return f"dmesg collection error: {e!s}"
 
-    # Strategy 2: Try with sudo if available (non-interactive)
-    if shutil.which("sudo"):
+    # Strategy 2: Try with sudo if available (non-interactive) and the user
+    # is in a group that could plausibly run it without a password
+    # dmesg stays a bare name under sudo: sudo resolves it via its own
+    # secure_path rather than running whatever the user's PATH found as root
+    sudo = shutil.which("sudo")
+    if sudo and _SUDO_GROUPS.intersection(_user_groups()):
         try:
-            dmesg_output = subprocess.check_output(
-                ["sudo", "-n", "dmesg", "--since", "-1min", "--time-format", "iso"],
-                text=True,
-                errors="ignore",
-                timeout=10
+            dmesg_output = _check_output_text(
+                [sudo, "-n", "dmesg", *_DMESG_ARGS], timeout=_DMESG_TIMEOUT
             )
-            log.add("dmesg", f"[via sudo] {dmesg_output.strip()}")
-            return
-        except subprocess.CalledProcessError:
-            pass  # Try next strategy
+            return f"[via sudo] {dmesg_output}"
         except subprocess.TimeoutExpired:
-            log.add("dmesg", "sudo dmesg command timed out")
-            return
-        except Exception:
-            pass  # Try next strategy
+            return "sudo dmesg command timed out"
+        except (subprocess.CalledProcessError, OSError):
+            pass  # sudo refused (password needed) or could not run: try next strategy
 
     # Strategy 3: Try reading from /var/log/dmesg if available
+    # No exists()/is_file() probes first: a missing file or a directory
+    # fails the read itself with an OSError, one syscall instead of three
     try:
-        from pathlib import Path
-        dmesg_file = Path("/var/log/dmesg")
-        if dmesg_file.exists() and dmesg_file.is_file():
-            content = dmesg_file.read_text(errors="ignore")[-2000:]  # Last 2KB
-            log.add("dmesg", f"[from /var/log/dmesg] {content}")
-            return
-    except Exception:
-        pass
+        content = _read_tail("/var/log/dmesg", DMESG_TAIL_BYTES)
+        return f"[from /var/log/dmesg] {content}"
+    except OSError:
+        pass  # Missing, or typically PermissionError: the file is root/adm only
 
     # All strategies failed - provide helpful error message
-    log.add("dmesg", """dmesg unavailable: insufficient permissions
+    return """dmesg unavailable: insufficient permissions
 
 SOLUTION: Add your user to the 'adm' group:
   sudo usermod -a -G adm $USER
   # Then logout and login again
 
 ALTERNATIVE: Run with sudo:
-  sudo chrome-troubleshooter diag""")
+  sudo chrome-troubleshooter diag"""
+
+
+def _read_kmsg(since_seconds: float) -> str | None:
+    """
+    Return the last since_seconds of kernel messages read from /dev/kmsg.
+
+    Each read() of the device returns one record; a non-blocking descriptor
+    raises BlockingIOError once the ring buffer is drained. Returns None if
+    /dev/kmsg cannot be opened (absent, or kernel.dmesg_restrict denies it)
+    so the caller can fall back to dmesg.
+    """
+    try:
+        fd = os.open("/dev/kmsg", os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return None
+
+    def records():
+        while True:
+            try:
+                record = os.read(fd, 8192)
+            except BlockingIOError:
+                return  # caught up with the ring buffer
+            except BrokenPipeError:
+                continue  # record overwritten while we read: skip it
+            if not record:
+                return
+            yield record
+
+    try:
+        # Record timestamps are microseconds since boot, on the monotonic clock
+        now = time.clock_gettime(time.CLOCK_MONOTONIC)
+        return _format_kmsg(records(), now - since_seconds, time.time() - now)
+    finally:
+        os.close(fd)
+
+
+def _format_kmsg(records, cutoff: float, boot_time: float) -> str:
+    """
+    Render /dev/kmsg records newer than cutoff like dmesg --time-format iso.
+
+    A record is "prio,seq,usec,flags[,...];message" followed by optional
+    indented KEY=value continuation lines, which dmesg doesn't show either.
+    cutoff is in seconds since boot and boot_time is the boot epoch.
+    """
+    lines = []
+    for record in records:
+        header, _, message = record.partition(b";")
+        try:
+            ts = int(header.split(b",")[2]) / 1_000_000
+        except (IndexError, ValueError):
+            continue
+        if ts < cutoff:
+            continue
+        stamp = datetime.fromtimestamp(boot_time + ts).astimezone()
+        text = message.split(b"\n", 1)[0].decode(errors="ignore")
+        lines.append(f"{stamp.isoformat(timespec='microseconds')} {text}")
+    return "\n".join(lines)
+
+
+def _check_output_text(cmd: list, timeout=None) -> str:
+    """
+    Run cmd and return its stripped stdout as text.
+
+    Captures raw bytes and decodes once, after stripping, instead of using
+    text=True: that skips the universal-newline translation pass over the
+    whole output and decodes only what is actually kept. Undecodable bytes
+    (common in kernel and journal messages) are dropped, as before.
+
+    Keep the spawn plain: no preexec_fn, cwd, user/group or session
+    options. Any of those forces CPython (3.10+) off its vfork() fast path
+    onto a full fork(), which copies the parent's page tables.
+    """
+    return subprocess.check_output(cmd, timeout=timeout).strip().decode(errors="ignore")
+
+
+def _read_tail(path, nbytes: int) -> str:
+    """
+    Return roughly the last nbytes of a text file without reading all of it.
+
+    Reads only the tail instead of loading the whole file and slicing, so
+    memory stays bounded however large the log has grown: one fstat() for
+    the size and one pread() at the tail offset, with no buffered file
+    object or seeks. When the read starts mid-file, the partial first
+    line is dropped.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        size = os.fstat(fd).st_size
+        start = max(0, size - nbytes)
+        data = os.pread(fd, size - start, start)
+    finally:
+        os.close(fd)
+    if start:
+        data = data.split(b"\n", 1)[-1]
+    return data.decode(errors="ignore")
+
+
+@functools.lru_cache(maxsize=None)
+def _user_groups() -> tuple:
+    """
+    Names of this process's supplementary groups.
+
+    Cached: group membership is fixed when the process starts, and each
+    lookup may read /etc/group or query NSS.
+
+    Returns:
+        tuple: Group names; gids without a group entry are left out
+    """
+    names = []
+    with contextlib.suppress(OSError):
+        for gid in os.getgroups():
+            # KeyError: a supplementary gid with no /etc/group entry
+            with contextlib.suppress(KeyError):
+                names.append(grp.getgrgid(gid).gr_name)
+    return tuple(names)
 
 
 def _check_system_access() -> dict:
@@ -168,27 +316,15 @@ def _check_system_access() -> dict:
     Returns diagnostic information about available tools and permissions.
     This helps users understand what functionality is available.
     """
-    import grp
-    import os
-
     access_info = {
         'dmesg_available': shutil.which('dmesg') is not None,
         'journalctl_available': shutil.which('journalctl') is not None,
         'sudo_available': shutil.which('sudo') is not None,
-        'user_groups': [],
+        'user_groups': list(_user_groups()),
         'can_read_var_log': False,
     }
 
-    # Get user groups for permission analysis
-    with contextlib.suppress(Exception):
-        access_info['user_groups'] = [grp.getgrgid(gid).gr_name for gid in os.getgroups()]
-
-    # Check if we can read /var/log
-    try:
-        from pathlib import Path
-        var_log = Path("/var/log")
-        access_info['can_read_var_log'] = var_log.exists() and os.access(var_log, os.R_OK)
-    except Exception:
-        pass
+    # Check if we can read /var/log (access() is False if it doesn't exist)
+    access_info['can_read_var_log'] = os.access("/var/log", os.R_OK)
 
     return access_info
@@ -16,7 +16,8 @@ Key design decisions from the audit:
 """
 
 import atexit
-import fcntl
+import os
+import select
 import subprocess
 import sys
 import time
@@ -26,22 +27,22 @@ from rich.console import Console
 
 # SINGLE SOURCE OF TRUTH: Updated imports after module deduplication
 # Following ChatGPT audit suggestion U-C1 for module cleanup
-from .constants import SESSION_FMT, get_cache_dir
+from .constants import SESSION_FMT, ensure_cache_dir
 from .logger import StructuredLogger as LogWriter
-from .utils import which_chrome
+from .utils import acquire_instance_lock, which_chrome
 
 _LOCK = Path("/tmp/chrome-troubleshooter.lock")
 # Lock file location in /tmp for system-wide single instance
 # Using /tmp ensures it's cleaned up on reboot
-# CRITICAL FIX: Global lock FD to prevent garbage collection
-# Following ChatGPT audit - "lock lives as long as FD lives"
-_LOCK.touch(exist_ok=True)
-LOCK_FD = _LOCK.open("w")                           # GLOBAL
-fcntl.flock(LOCK_FD, fcntl.LOCK_EX | fcntl.LOCK_NB)
-atexit.register(LOCK_FD.close)                      # deterministic cleanup
+# The open lock file is kept here once _acquire_lock() succeeds ("lock
+# lives as long as FD lives"). Nothing is opened or locked at import time:
+# importing for --help must not steal, or fail on, a live instance's lock.
+_state = {}
 # --enable-logging=stderr: Send Chrome logs to stderr for capture
 # --v=1: Verbose logging level 1 (basic debugging info)
-SAFE_FLAGS = ["--enable-logging=stderr", "--v=1"]
+SAFE_FLAGS = ("--enable-logging=stderr", "--v=1")
+# How often a silent Chrome is checked for having exited
+_POLL_INTERVAL = 0.1
 
 # Global Rich console for consistent formatting
 console = Console()
@@ -52,35 +53,28 @@ def _acquire_lock():
     Acquire single-instance lock using fcntl.
 
     This function implements the exact locking strategy from the ChatGPT audit:
-    1. Create lock file if it doesn't exist
-    2. Open file for read/write access
-    3. Attempt non-blocking exclusive lock
-    4. Exit with error code 1 if another instance is running
+    1. Open the lock file, creating it if it doesn't exist
+    2. Attempt non-blocking exclusive lock
+    3. Exit with error code 1 if another instance is running
 
     Returns:
-        file object: Open file descriptor for the lock file
+        int: Open file descriptor for the lock file
 
     Exits:
         System exit code 1 if another instance is already running
 
     The lock is automatically released when the file descriptor is closed
-    or when the process exits.
+    or when the process exits. Calling it again while the lock is held
+    returns the same file: a second open file would conflict with the first.
     """
-    # Create lock file if it doesn't exist
-    # exist_ok=True prevents race condition if multiple processes start simultaneously
-    _LOCK.touch(exist_ok=True)
-
-    # Open lock file for read/write access
-    # This file descriptor must remain open to maintain the lock
-    lock_fd = _LOCK.open("r+")
-
-    try:
-        # Attempt to acquire exclusive, non-blocking lock
-        # LOCK_EX: Exclusive lock (only one process can hold it)
-        # LOCK_NB: Non-blocking (fail immediately if lock unavailable)
-        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-        return lock_fd
-    except BlockingIOError:
+    if "lock_fd" in _state:
+        return _state["lock_fd"]
+
+    # One os.open(O_CREAT | O_CLOEXEC) creates and opens the file (no
+    # separate touch()), then a non-blocking exclusive flock. The descriptor
+    # must remain open to maintain the lock; O_CLOEXEC keeps it out of Chrome
+    lock_fd = acquire_instance_lock(str(_LOCK))
+    if lock_fd is None:
         # Another instance is already running
         # Display clear error message and exit with standard error code
         console.print(
@@ -88,6 +82,67 @@ def _acquire_lock():
         )
         sys.exit(1)
 
+    _state["lock_fd"] = lock_fd
+    atexit.register(_release_lock)  # deterministic cleanup
+    return lock_fd
+
+
+def _release_lock() -> None:
+    """Close the lock file (releasing the lock) if _acquire_lock() took it"""
+    lock_fd = _state.pop("lock_fd", None)
+    if lock_fd is not None:
+        os.close(lock_fd)
+        atexit.unregister(_release_lock)
+
+
+def _read_available(fd: int, output: bytearray) -> bool:
+    """Append everything buffered on non-blocking fd; False once at EOF"""
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return True
+        if not chunk:
+            return False
+        output += chunk
+
+
+def _drain_until_exit(process: subprocess.Popen, timeout: float) -> tuple[bytes, bool]:
+    """
+    Read process's stdout until it exits or timeout seconds pass.
+
+    The pipe is drained as data arrives, so a chatty child never fills the
+    64 KiB pipe buffer and stalls in write() while nobody is reading.
+
+    Returns:
+        Output read so far, and whether the process exited before timeout
+    """
+    fd = process.stdout.fileno()
+    os.set_blocking(fd, False)
+    output = bytearray()
+    deadline = time.monotonic() + timeout
+    stream_open = True
+
+    while process.poll() is None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return bytes(output), False
+        wait = min(remaining, _POLL_INTERVAL)
+        if stream_open:
+            # Wakes as soon as output arrives; the cap bounds how late an
+            # exit with no further output is noticed
+            ready, _, _ = select.select([fd], [], [], wait)
+            if ready:
+                stream_open = _read_available(fd, output)
+        else:
+            # Chrome closed its stdout but is still running
+            time.sleep(wait)
+
+    # Pick up whatever was written just before exit
+    if stream_open:
+        _read_available(fd, output)
+    return bytes(output), True
+
 
 def safe_launch(timeout: int = 15) -> None:
     """
@@ -113,7 +168,7 @@ def safe_launch(timeout: int = 15) -> None:
     """
     # Acquire single-instance lock first
     # This prevents multiple Chrome troubleshooter instances
-    lock_fd = _acquire_lock()
+    _acquire_lock()
 
     # Find Chrome executable with user override support
     chrome_path = which_chrome()
@@ -127,8 +182,7 @@ def safe_launch(timeout: int = 15) -> None:
 
     # Get cache directory and ensure it exists (moved from import-time to runtime)
     # CRITICAL FIX: Prevents import hangs from filesystem operations
-    cache_dir = get_cache_dir()
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = ensure_cache_dir()
 
     # Create session directory with ISO timestamp
     # This provides unique directory for each launch attempt
@@ -143,30 +197,27 @@ def safe_launch(timeout: int = 15) -> None:
     log.add("launcher", " ".join(chrome_command))
 
     # Launch Chrome process with output capture
-    # stdout and stderr are captured for analysis
-    # text=True ensures string handling instead of bytes
+    # stdout and stderr are captured for analysis (raw bytes, saved as-is)
     with subprocess.Popen(
         chrome_command,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,  # Merge stderr into stdout
-        text=True,
     ) as chrome_process:
 
-        try:
-            # Wait for Chrome to exit or timeout
-            # If Chrome exits quickly, it likely failed to start
-            # If timeout expires, Chrome is considered stable
-            chrome_process.wait(timeout=timeout)
+        # Wait for Chrome to exit or timeout, reading its output meanwhile
+        # If Chrome exits quickly, it likely failed to start
+        # If timeout expires, Chrome is considered stable
+        stdout_output, exited = _drain_until_exit(chrome_process, timeout)
 
+        if exited:
             # Chrome exited before timeout - likely an error
             log.add("exit", f"Chrome quit early, code={chrome_process.returncode}")
 
-            # Capture and save Chrome's output for analysis
-            stdout_output, _ = chrome_process.communicate()
+            # Save Chrome's output for analysis
             chrome_log_file = session_dir / "chrome_stdout.log"
-            chrome_log_file.write_text(stdout_output or "")
+            chrome_log_file.write_bytes(stdout_output)
 
-        except subprocess.TimeoutExpired:
+        else:
             # Chrome survived the timeout period - success!
             # This is the expected case for successful Chrome launch
             log.add("launcher", "Chrome alive after timeout – success")
@@ -174,4 +225,4 @@ def safe_launch(timeout: int = 15) -> None:
 
     # Clean up lock file descriptor
     # This releases the single-instance lock
-    lock_fd.close()
+    _release_lock()
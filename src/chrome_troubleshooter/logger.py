@@ -4,17 +4,22 @@
 Advanced logging with JSON Lines, SQLite, and real-time terminal output
 """
 
+import atexit
 import fcntl
-import gzip
+import os
+import queue
 import shutil
 import sqlite3
 import sys
 import threading
+import time
 from contextlib import contextmanager, suppress
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .utils import dir_size
+
 # Optimized JSON handling with orjson fallback (5-10x performance improvement)
 try:
     import orjson as _json
@@ -45,6 +50,17 @@ except ImportError:
     Fore = Style = MockColor()
     HAS_COLORS = False
 
+# BUFFERED WRITES: entries are queued and a background thread appends them
+# in batches (one write() per file and one SQLite commit per batch) instead
+# of reopening, locking and committing for every entry. A batch is written
+# once it spans _FLUSH_INTERVAL seconds or _FLUSH_BYTES of text, whichever
+# comes first; the bounded queue makes very chatty callers wait rather
+# than grow memory without limit.
+_FLUSH_INTERVAL = 0.1
+_FLUSH_BYTES = 64 * 1024
+_QUEUE_SIZE = 1024
+_STOP = object()  # queue sentinel: write what is pending, then exit
+
 
 class StructuredLogger:
     """Thread-safe structured logger with multiple output formats"""
@@ -71,19 +87,33 @@ class StructuredLogger:
         # Thread safety
         self._lock = threading.Lock()
         self._db_connection = None
+        self._closed = False
 
         # Initialize storage
         self._init_sqlite()
         self._init_json()
+        self._open_files()
+
+        # Background writer; close() (or interpreter exit, for callers that
+        # never close) drains the queue before the files are closed
+        self._queue: queue.Queue = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._writer = threading.Thread(
+            target=self._drain_queue, name="log-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
         # Auto-rotate old sessions (ChatGPT suggestion U4)
         self._rotate_old_sessions()
 
         # Session metadata
         self.session_start = datetime.now()
+        # Formatted once: every SQLite row and JSON line carries it, so
+        # re-running isoformat() per entry was pure overhead
+        self.session_id = self.session_start.isoformat()
         self.log_count = 0
 
-        self.info("logger", f"Session started: {self.session_start.isoformat()}")
+        self.info("logger", f"Session started: {self.session_id}")
 
     def _init_sqlite(self) -> None:
         """Initialize SQLite database with optimized settings"""
@@ -165,6 +195,21 @@ class StructuredLogger:
             print(f"Warning: JSON file initialization failed: {e}", file=sys.stderr)
             self.enable_json = False
 
+    def _open_files(self) -> None:
+        """Open the text and JSON Lines logs once for the whole session"""
+        self._text_fh = None
+        self._json_fh = None
+        try:
+            self._text_fh = open(self.log_file, "a", encoding="utf-8")
+        except OSError as e:
+            print(f"Warning: Text log initialization failed: {e}", file=sys.stderr)
+        if self.enable_json:
+            try:
+                self._json_fh = open(self.json_file, "a", encoding="utf-8")
+            except OSError as e:
+                print(f"Warning: JSON file initialization failed: {e}", file=sys.stderr)
+                self.enable_json = False
+
     def _rotate_old_sessions(self, max_age_days: int = 7, max_size_mb: int = 200) -> None:
         """Auto-rotate old sessions to prevent SSD bloat (ChatGPT suggestion U4)"""
         try:
@@ -172,21 +217,34 @@ class StructuredLogger:
             if not cache_dir.exists():
                 return
 
-            cutoff_date = datetime.now() - timedelta(days=max_age_days)
+            # Epoch cutoff: compared directly against st_mtime, no datetime
+            # object per session
+            cutoff_ts = time.time() - max_age_days * 86400
             max_size_bytes = max_size_mb * 1024 * 1024
 
-            for session_dir in cache_dir.glob("session_*"):
-                if not session_dir.is_dir():
-                    continue
-
+            # One scandir pass; the name and is_dir() checks come from
+            # readdir. Materialized first because sessions are removed below.
+            with os.scandir(cache_dir) as it:
+                candidates = [
+                    entry
+                    for entry in it
+                    if entry.name.startswith("session_")
+                    and entry.is_dir(follow_symlinks=False)
+                ]
+
+            for entry in candidates:
+                session_dir = Path(entry.path)
                 try:
-                    # Check age
-                    mtime = datetime.fromtimestamp(session_dir.stat().st_mtime)
+                    # Check age first: an expired session is rotated anyway,
+                    # so its (possibly large) tree is never walked for size
+                    expired = entry.stat().st_mtime < cutoff_ts
+                    total_size = None if expired else dir_size(entry.path)
 
-                    # Check size
-                    total_size = sum(f.stat().st_size for f in session_dir.rglob("*") if f.is_file())
+                    if expired or total_size > max_size_bytes:
+                        # Only needed when a session is actually rotated,
+                        # which most logger start-ups never do
+                        import gzip
 
-                    if mtime < cutoff_date or total_size > max_size_bytes:
                         # Compress JSONL files before archiving
                         jsonl_file = session_dir / "logs.jsonl"
                         if jsonl_file.exists() and jsonl_file.stat().st_size > 1024:  # Only compress if > 1KB
@@ -203,8 +261,10 @@ class StructuredLogger:
                         # Remove original directory
                         shutil.rmtree(session_dir, ignore_errors=True)
 
-                        reason = "age" if mtime < cutoff_date else "size"
-                        print(f"Rotated session {session_dir.name} ({reason}): {total_size:,} bytes -> {archive_path.name}")
+                        if expired:
+                            print(f"Rotated session {session_dir.name} (age) -> {archive_path.name}")
+                        else:
+                            print(f"Rotated session {session_dir.name} (size): {total_size:,} bytes -> {archive_path.name}")
 
                 except (OSError, ValueError) as e:
                     print(f"Warning: Failed to rotate session {session_dir.name}: {e}", file=sys.stderr)
@@ -233,86 +293,123 @@ class StructuredLogger:
         color = color_map.get(level.upper(), "")
         return f"{color}{text}{Style.RESET_ALL}" if color else text
 
-    def _write_to_sqlite(
+    def _json_line(
         self,
         timestamp: str,
         level: str,
         source: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Write log entry to SQLite database"""
-        if not self.enable_sqlite or not self._db_connection:
-            return
+    ) -> Optional[str]:
+        """Serialize one JSON Lines entry (None when JSON output is off)"""
+        if not self.enable_json:
+            return None
+
+        log_entry = {
+            "ts": timestamp,
+            "level": level,
+            "source": source,
+            "content": content,
+            "session_id": self.session_id,
+        }
+        if metadata:
+            log_entry["metadata"] = metadata
 
         try:
-            metadata_json = dumps(metadata) if metadata else None
-            session_id = self.session_start.isoformat()
-
-            self._db_connection.execute(
-                "INSERT INTO logs (ts, level, source, content, session_id, metadata) VALUES (?, ?, ?, ?, ?, ?)",
-                (timestamp, level, source, content, session_id, metadata_json),
-            )
-            self._db_connection.commit()
-
-        except sqlite3.Error as e:
-            print(f"SQLite write error: {e}", file=sys.stderr)
+            return dumps(log_entry) + "\n"
+        except Exception as e:
+            # Unserializable metadata must not lose the entry itself
+            print(f"JSON write error: {e}", file=sys.stderr)
+            del log_entry["metadata"]
+            return dumps(log_entry) + "\n"
 
-    def _write_to_json(
+    def _sqlite_row(
         self,
         timestamp: str,
         level: str,
         source: str,
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Write log entry to JSON Lines file"""
-        if not self.enable_json:
-            return
+    ) -> Optional[tuple]:
+        """Build one logs table row (None when SQLite output is off)"""
+        if not self.enable_sqlite:
+            return None
 
         try:
-            log_entry = {
-                "ts": timestamp,
-                "level": level,
-                "source": source,
-                "content": content,
-                "session_id": self.session_start.isoformat(),
-            }
-
-            if metadata:
-                log_entry["metadata"] = metadata
-
-            with open(self.json_file, "a", encoding="utf-8") as f:
-                # Use file locking for concurrent access
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            metadata_json = dumps(metadata) if metadata else None
+        except Exception as e:
+            print(f"SQLite write error: {e}", file=sys.stderr)
+            metadata_json = None
+        return (timestamp, level, source, content, self.session_id, metadata_json)
+
+    def _drain_queue(self) -> None:
+        """Writer thread: collect queued entries into batches and write them"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch, flushed, size = [], [], 0
+            deadline = time.monotonic() + _FLUSH_INTERVAL
+
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    # flush() request: write what we have right away
+                    flushed.append(item)
+                    break
+                batch.append(item)
+                size += len(item[0])
+                if size >= _FLUSH_BYTES:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    f.write(dumps(log_entry) + "\n")
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-        except (OSError, Exception) as e:
-            print(f"JSON write error: {e}", file=sys.stderr)
-
-    def _write_to_terminal(
-        self, timestamp: str, level: str, source: str, content: str
-    ) -> None:
-        """Write log entry to terminal and text log file"""
-        formatted_msg = f"[{timestamp}][{level}][{source}] {content}"
-        colored_msg = self._colorize(formatted_msg, level)
-
-        # Write to terminal
-        print(colored_msg, flush=True)
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+            for event in flushed:
+                event.set()
+
+    def _write_batch(self, batch: list) -> None:
+        """Append a batch of entries to every enabled output"""
+        self._append(self._text_fh, "".join(entry[0] for entry in batch), "Text log")
+        if self._json_fh is not None:
+            self._append(
+                self._json_fh, "".join(entry[1] for entry in batch if entry[1]), "JSON"
+            )
 
-        # Write to text log file
+        rows = [entry[2] for entry in batch if entry[2]]
+        if rows and self._db_connection:
+            try:
+                self._db_connection.executemany(
+                    "INSERT INTO logs (ts, level, source, content, session_id, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._db_connection.commit()
+            except sqlite3.Error as e:
+                print(f"SQLite write error: {e}", file=sys.stderr)
+
+    @staticmethod
+    def _append(fh, text: str, label: str) -> None:
+        """Write text to an open log file under an exclusive flock"""
+        if fh is None or not text:
+            return
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    f.write(formatted_msg + "\n")
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            # Use file locking for concurrent access; flushing inside the
+            # lock makes the whole batch a single write() while it is held
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                fh.write(text)
+                fh.flush()
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
         except OSError as e:
-            print(f"Text log write error: {e}", file=sys.stderr)
+            print(f"{label} write error: {e}", file=sys.stderr)
 
     def log(
         self,
@@ -326,10 +423,29 @@ class StructuredLogger:
             timestamp = self._get_timestamp()
             self.log_count += 1
 
-            # Write to all outputs
-            self._write_to_terminal(timestamp, level, source, content)
-            self._write_to_sqlite(timestamp, level, source, content, metadata)
-            self._write_to_json(timestamp, level, source, content, metadata)
+            # The terminal stays synchronous so output appears in real time
+            formatted_msg = f"[{timestamp}][{level}][{source}] {content}"
+            print(self._colorize(formatted_msg, level), flush=True)
+
+            if self._closed:
+                return
+
+            # Serialized here, in the caller's thread, so the writer thread
+            # only does I/O; queued under the lock to keep entry order
+            self._queue.put((
+                formatted_msg + "\n",
+                self._json_line(timestamp, level, source, content, metadata),
+                self._sqlite_row(timestamp, level, source, content, metadata),
+            ))
+
+    def flush(self) -> None:
+        """Block until every entry logged so far has been written"""
+        with self._lock:
+            if self._closed:
+                return
+            done = threading.Event()
+            self._queue.put(done)
+        done.wait()
 
     def debug(
         self, source: str, content: str, metadata: Optional[Dict[str, Any]] = None
@@ -384,15 +500,31 @@ class StructuredLogger:
         self.info(source, content, metadata)
 
     def close(self) -> None:
-        """Close all resources"""
-        with self._lock:
-            if self._db_connection:
-                with suppress(sqlite3.Error):
-                    self._db_connection.close()
-                self._db_connection = None
+        """Write pending entries and close all resources"""
+        if self._closed:
+            return
+
+        # Logged first so they reach the files too, and without holding
+        # self._lock: log() takes it, so logging under it would deadlock
+        self.info("logger", f"Session ended: {datetime.now().isoformat()}")
+        self.info("logger", f"Total log entries: {self.log_count}")
 
-            self.info("logger", f"Session ended: {datetime.now().isoformat()}")
-            self.info("logger", f"Total log entries: {self.log_count}")
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._writer.join()
+        atexit.unregister(self.close)
+
+        for fh in (self._text_fh, self._json_fh):
+            if fh is not None:
+                with suppress(OSError):
+                    fh.close()
+        if self._db_connection:
+            with suppress(sqlite3.Error):
+                self._db_connection.close()
+            self._db_connection = None
 
     def __enter__(self):
         return self
@@ -405,23 +537,34 @@ class StructuredLogger:
         """Context manager to capture stdout/stderr to logs"""
 
         class LogCapture:
-            def __init__(self, logger, source, level):
+            def __init__(self, logger, source, level, passthrough):
                 self.logger = logger
                 self.source = source
                 self.level = level
                 self.buffer = []
+                self.passthrough = passthrough
+                self._busy = threading.local()
 
             def write(self, text):
+                # log() echoes each entry to sys.stdout, which is this
+                # object: send that echo to the real stream instead of
+                # logging it again (and re-taking the logger's lock)
+                if getattr(self._busy, "active", False):
+                    return self.passthrough.write(text)
                 if text.strip():
-                    self.logger.log(self.level, self.source, text.strip())
+                    self._busy.active = True
+                    try:
+                        self.logger.log(self.level, self.source, text.strip())
+                    finally:
+                        self._busy.active = False
                 return len(text)
 
             def flush(self):
-                pass
+                self.passthrough.flush()
 
-        capture = LogCapture(self, source, level)
         old_stdout = sys.stdout
         old_stderr = sys.stderr
+        capture = LogCapture(self, source, level, old_stdout)
 
         try:
             sys.stdout = capture
@@ -433,8 +576,10 @@ class StructuredLogger:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get logging statistics"""
+        # File sizes below should include everything logged so far
+        self.flush()
         stats = {
-            "session_start": self.session_start.isoformat(),
+            "session_start": self.session_id,
             "log_count": self.log_count,
             "sqlite_enabled": self.enable_sqlite,
             "json_enabled": self.enable_json,
@@ -447,11 +592,11 @@ class StructuredLogger:
             },
         }
 
-        # Add file sizes if they exist
-        for key, path in stats["files"].items():
-            if not key.endswith("_size"):  # Skip size entries
-                path_obj = Path(path)
-                if path_obj.exists():
-                    stats["files"][f"{key}_size"] = path_obj.stat().st_size
+        # Add file sizes if they exist (iterate a copy: sizes are added to
+        # the same dict)
+        for key, path in list(stats["files"].items()):
+            path_obj = Path(path)
+            if path_obj.exists():
+                stats["files"][f"{key}_size"] = path_obj.stat().st_size
 
         return stats
@@ -17,9 +17,16 @@ from __future__ import annotations
 
 import os
 import shutil
-import subprocess
 import sys
-import textwrap
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# subprocess and textwrap are only needed by run(), and textwrap only on its
+# failure path: importing them lazily keeps them off the startup path of
+# every module that just wants which_chrome() or dir_size()
+if TYPE_CHECKING:
+    import subprocess
 
 
 def which_chrome() -> str | None:
@@ -71,6 +78,163 @@ def which_chrome() -> str | None:
     return None
 
 
+def dir_size(path) -> int:
+    """
+    Return the total size in bytes of the files below path.
+
+    Walks the tree with os.scandir() instead of Path.rglob("*"): DirEntry
+    objects carry the file type from readdir, so only one stat() runs per
+    file and no Path objects are allocated.
+
+    Matches the old rglob("*") + is_file() sum: symlinked directories are
+    not descended into, symlinked files count their target's size, and
+    unreadable or vanished directories are skipped rather than raising.
+
+    Args:
+        path: Directory to measure (str or path-like)
+
+    Returns:
+        int: Sum of st_size over all files in the tree
+    """
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                    except OSError:
+                        continue  # Vanished entry
+        except OSError:
+            continue  # Unreadable or removed directory
+    return total
+
+
+def newest_session(cache_dir) -> Path | None:
+    """
+    Return the most recent session_* directory in cache_dir, or None.
+
+    Session names embed their creation time (SESSION_FMT), so the newest
+    session is simply the greatest name. One os.scandir() pass tracks that
+    maximum directly instead of materialising a glob() list of Path
+    objects and sorting through it with max().
+
+    Args:
+        cache_dir: Directory holding the session folders (str or path-like)
+
+    Returns:
+        Path: The newest session directory
+        None: If cache_dir is missing or holds no sessions
+    """
+    newest = None
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.startswith("session_") and entry.is_dir():
+                    if newest is None or entry.name > newest.name:
+                        newest = entry
+    except FileNotFoundError:
+        return None
+    return Path(newest.path) if newest is not None else None
+
+
+def create_session_dir(base_dir: Path) -> Path:
+    """
+    Create and return a fresh session_YYYYmmdd_HHMMSS directory in base_dir.
+
+    The timestamp keeps names sortable for newest_session(). Two sessions
+    started within the same second get a numeric suffix rather than
+    silently sharing (and interleaving logs in) one directory.
+
+    base_dir usually exists already, so a single mkdir() is tried first;
+    the parents=True walk up the tree only runs when that fails because
+    base_dir is missing (the first session).
+
+    Args:
+        base_dir: Directory that holds the session folders
+
+    Returns:
+        Path: The newly created session directory
+    """
+    name = time.strftime("session_%Y%m%d_%H%M%S")
+    session_dir = base_dir / name
+    suffix = 0
+    while True:
+        try:
+            session_dir.mkdir()
+            return session_dir
+        except FileNotFoundError:
+            base_dir.mkdir(parents=True, exist_ok=True)
+        except FileExistsError:
+            suffix += 1
+            session_dir = base_dir / f"{name}_{suffix}"
+
+
+def acquire_instance_lock(path: str) -> int | None:
+    """
+    Take a non-blocking exclusive flock on path and return its descriptor.
+
+    Unlike an exists()/touch()/unlink() lock file there is no window
+    between checking and creating the lock, and the kernel releases it
+    when the descriptor is closed or the process dies, so a crashed run
+    can never leave a stale lock behind. The file itself is left in place.
+
+    Args:
+        path: Lock file location (created if missing)
+
+    Returns:
+        int: Open descriptor holding the lock; close it to release
+        None: If another process already holds the lock
+    """
+    import fcntl  # POSIX only; imported here so utils still loads elsewhere
+
+    fd = os.open(path, os.O_CREAT | os.O_RDWR | os.O_CLOEXEC, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def write_json(path, data) -> None:
+    """
+    Write data to path as indented JSON, using orjson when it is installed.
+
+    json.dump(indent=...) falls back to the pure-Python encoder; orjson
+    serializes straight to bytes in C and is written with a single write().
+    The stdlib fallback streams json.dump's many small chunks through a
+    128 KiB buffer instead of the default 8 KiB, cutting write() syscalls.
+    default=str keeps Paths and datetimes in diagnostics writable with
+    either backend.
+
+    Args:
+        path: Output file (str or path-like)
+        data: JSON-serializable object
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        with open(path, "w", buffering=128 * 1024) as f:
+            json.dump(data, f, indent=2, default=str)
+        return
+
+    with open(path, "wb") as f:
+        f.write(
+            orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+
+
 def run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
     """
     subprocess.run wrapper that prints stderr on failure.
@@ -107,6 +271,8 @@ def run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
             # Error details automatically printed to stderr
             pass
     """
+    import subprocess
+
     try:
         # Execute subprocess with enhanced defaults
         # check=True: Raise exception on non-zero exit
@@ -114,6 +280,8 @@ def run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
         # capture_output=True: Capture stdout/stderr for analysis
         return subprocess.run(cmd, check=True, text=True, capture_output=True, **kwargs)
     except subprocess.CalledProcessError as exc:
+        import textwrap
+
         # Format and display detailed error information
         # Using textwrap.dedent for clean multi-line formatting
         error_report = textwrap.dedent(
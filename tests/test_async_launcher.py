@@ -4,7 +4,8 @@ Tests for AsyncChromeLauncher
 """
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+import sys
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -65,19 +66,61 @@ class TestAsyncChromeLauncher:
         assert 'chromium' in paths
         assert len(paths) >= 2
 
+    def test_chrome_paths_cached_per_path(self, mock_config, mock_logger):
+        """Test launchers share one Chrome lookup per PATH value."""
+        from chrome_troubleshooter import async_launcher
+
+        async_launcher._cached_chrome_paths.cache_clear()
+        try:
+            with patch('shutil.which', return_value=None) as mock_which, \
+                 patch.dict('os.environ', {'PATH': '/nowhere'}):
+                AsyncChromeLauncher(mock_config, mock_logger)
+                calls = mock_which.call_count
+                launcher = AsyncChromeLauncher(mock_config, mock_logger)
+                assert mock_which.call_count == calls
+                assert launcher.chrome_paths == []
+
+                # A different PATH is resolved afresh
+                with patch.dict('os.environ', {'PATH': '/elsewhere'}):
+                    AsyncChromeLauncher(mock_config, mock_logger)
+                assert mock_which.call_count == 2 * calls
+        finally:
+            async_launcher._cached_chrome_paths.cache_clear()
+
     @pytest.mark.asyncio
     async def test_verify_chrome_running_success(self, launcher):
         """Test Chrome process verification - success case."""
         with patch('psutil.pid_exists', return_value=True), \
              patch('psutil.Process') as mock_process_class:
 
-            mock_process = Mock()
+            # MagicMock: oneshot() is used as a context manager
+            mock_process = MagicMock()
             mock_process.name.return_value = 'chrome'
             mock_process.status.return_value = 'running'
+            mock_process.is_running.return_value = True
             mock_process_class.return_value = mock_process
 
             result = await launcher._verify_chrome_running(12345)
             assert result is True
+            # One handle serves both checks, each inside a oneshot() snapshot
+            mock_process_class.assert_called_once_with(12345)
+            assert mock_process.oneshot.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_chrome_running_exits_during_startup(self, launcher):
+        """Test Chrome process verification - process gone after the pause."""
+        with patch('psutil.pid_exists', return_value=True), \
+             patch('psutil.Process') as mock_process_class, \
+             patch('asyncio.sleep', new=AsyncMock()):
+
+            mock_process = MagicMock()
+            mock_process.name.return_value = 'chrome'
+            mock_process.status.return_value = 'running'
+            mock_process.is_running.return_value = False
+            mock_process_class.return_value = mock_process
+
+            result = await launcher._verify_chrome_running(12345)
+            assert result is False
 
     @pytest.mark.asyncio
     async def test_verify_chrome_running_not_exists(self, launcher):
@@ -93,7 +136,7 @@ class TestAsyncChromeLauncher:
              patch('psutil.Process') as mock_process_class, \
              patch('psutil.STATUS_ZOMBIE', 'zombie'):
 
-            mock_process = Mock()
+            mock_process = MagicMock()
             mock_process.name.return_value = 'chrome'
             mock_process.status.return_value = 'zombie'
             mock_process_class.return_value = mock_process
@@ -101,11 +144,10 @@ class TestAsyncChromeLauncher:
             result = await launcher._verify_chrome_running(12345)
             assert result is False
 
-    @pytest.mark.asyncio
-    async def test_apply_environment_fixes_wayland(self, launcher):
+    def test_apply_environment_fixes_wayland(self, launcher):
         """Test environment fixes for Wayland."""
         with patch.dict('os.environ', {'XDG_SESSION_TYPE': 'wayland'}):
-            flags = await launcher._apply_environment_fixes(['--test-flag'])
+            flags = launcher._apply_environment_fixes(['--test-flag'])
 
             assert '--test-flag' in flags
             assert '--ozone-platform=x11' in flags
@@ -114,16 +156,248 @@ class TestAsyncChromeLauncher:
     @pytest.mark.asyncio
     async def test_apply_selinux_fix(self, launcher):
         """Test SELinux fix application."""
-        with patch('asyncio.create_subprocess_exec') as mock_subprocess:
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess, \
+             patch('shutil.which', return_value='/usr/sbin/tool'), \
+             patch('os.geteuid', return_value=1000):
             # Mock getenforce command
             mock_process = AsyncMock()
             mock_process.communicate.return_value = (b'Enforcing\n', b'')
+            mock_process.returncode = 0
+            mock_subprocess.return_value = mock_process
+
+            await launcher._apply_selinux_fix()
+
+            # Should call getenforce and then a non-interactive sudo semanage
+            assert mock_subprocess.call_count == 2
+            assert mock_subprocess.call_args_list[1].args[:2] == ('sudo', '-n')
+
+            # Retries reuse the first result instead of forking again
+            await launcher._apply_selinux_fix()
+            assert mock_subprocess.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_apply_selinux_fix_as_root(self, launcher):
+        """Test root runs semanage without sudo."""
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess, \
+             patch('shutil.which', return_value='/usr/sbin/tool'), \
+             patch('os.geteuid', return_value=0):
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (b'Enforcing\n', b'')
+            mock_process.returncode = 0
             mock_subprocess.return_value = mock_process
 
             await launcher._apply_selinux_fix()
 
-            # Should call getenforce and semanage
-            assert mock_subprocess.call_count >= 1
+            assert mock_subprocess.call_args_list[1].args[0] == 'semanage'
+
+    @pytest.mark.asyncio
+    async def test_apply_selinux_fix_without_tools(self, launcher):
+        """Test no subprocess is spawned when SELinux tools are absent."""
+        with patch('asyncio.create_subprocess_exec') as mock_subprocess, \
+             patch('shutil.which', return_value=None):
+            await launcher._apply_selinux_fix()
+
+            mock_subprocess.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_monitors_skip_missing_tools(self, launcher):
+        """Test dmesg/journalctl monitors don't spawn when the tools are absent."""
+        from chrome_troubleshooter import async_launcher
+
+        async_launcher._have.cache_clear()
+        try:
+            with patch('shutil.which', return_value=None) as mock_which, \
+                 patch('asyncio.create_subprocess_exec') as mock_subprocess:
+                await launcher._monitor_dmesg()
+                await launcher._collect_journal_logs()
+                await launcher._monitor_dmesg()
+
+                mock_subprocess.assert_not_called()
+                # Each tool is probed once, then served from the cache
+                assert mock_which.call_count == 2
+        finally:
+            async_launcher._have.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_monitor_dmesg_filters_chrome_lines(self, launcher):
+        """Test only chrome lines are logged and the follower is stopped."""
+        from chrome_troubleshooter import async_launcher
+
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"usb 1-1: new device\nChrome[42]: segfault \xff\ntrap")
+        stream.feed_data(b"s in chrome\n")
+        stream.feed_eof()
+        mock_process = Mock(stdout=stream)
+
+        with patch.object(async_launcher, '_have', return_value=True), \
+             patch('asyncio.create_subprocess_exec', new=AsyncMock(return_value=mock_process)):
+            await launcher._monitor_dmesg()
+
+        logged = [c.args for c in launcher.logger.info.call_args_list]
+        assert logged == [
+            ("dmesg", "Chrome[42]: segfault \ufffd"),
+            ("dmesg", "traps in chrome"),
+        ]
+        mock_process.kill.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_request_stop_cuts_backoff_short(self, launcher):
+        """Test a stop request ends the retry loop without the 2s backoff."""
+        launcher.chrome_paths = ['chrome']
+        launcher.config.enable_flatpak_fallback = True
+
+        async def failing_launch(path, flags, attempt):
+            launcher.request_stop()
+            return False
+
+        with patch.object(launcher, '_launch_chrome_async', side_effect=failing_launch), \
+             patch.object(launcher, '_apply_selinux_fix', new=AsyncMock()), \
+             patch.object(launcher, '_collect_concurrent_diagnostics', new=AsyncMock()), \
+             patch.object(launcher, '_try_flatpak_fallback', new=AsyncMock()) as flatpak:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await launcher.launch_with_concurrent_diagnostics()
+
+        assert result is False
+        assert loop.time() - started < 1
+        assert len(launcher.attempts) == 1
+        flatpak.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_selinux_fix_applied_once_per_launch(self, launcher):
+        """Test the SELinux fix runs before the strategies, not per attempt."""
+        launcher.chrome_paths = ['chrome']
+        launcher.config.max_attempts = 3
+        launcher.config.enable_flatpak_fallback = False
+
+        with patch.object(launcher, '_launch_chrome_async', new=AsyncMock(return_value=False)), \
+             patch.object(launcher, '_apply_selinux_fix', new=AsyncMock()) as selinux, \
+             patch.object(launcher, '_collect_concurrent_diagnostics', new=AsyncMock()), \
+             patch.object(launcher, '_stop_requested_within', new=AsyncMock(return_value=False)):
+            await launcher.launch_with_concurrent_diagnostics()
+
+        assert len(launcher.attempts) == 3
+        selinux.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_backoff_after_last_allowed_attempt(self, launcher):
+        """Test max_attempts stops retries without a trailing sleep."""
+        launcher.chrome_paths = ['chrome']
+        launcher.config.max_attempts = 1
+        launcher.config.enable_flatpak_fallback = False
+
+        with patch.object(launcher, '_launch_chrome_async', new=AsyncMock(return_value=False)), \
+             patch.object(launcher, '_apply_selinux_fix', new=AsyncMock()), \
+             patch.object(launcher, '_collect_concurrent_diagnostics', new=AsyncMock()), \
+             patch.object(launcher, '_stop_requested_within', new=AsyncMock()) as backoff:
+            result = await launcher.launch_with_concurrent_diagnostics()
+
+        assert result is False
+        backoff.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_strategy_flags_are_fresh_per_attempt(self, launcher):
+        """Test environment fixes never leak into the shared strategy table."""
+        from chrome_troubleshooter import async_launcher
+
+        launcher.chrome_paths = ['chrome']
+        launcher.config.max_attempts = 2
+        launcher.config.extra_flags = ['--extra']
+        launcher.config.enable_flatpak_fallback = False
+        launcher._selinux_checked = True
+        strategies = AsyncChromeLauncher._STRATEGIES
+
+        with patch.dict('os.environ', {'XDG_SESSION_TYPE': 'wayland'}), \
+             patch.object(launcher, '_launch_chrome_async', new=AsyncMock(return_value=False)), \
+             patch.object(launcher, '_collect_concurrent_diagnostics', new=AsyncMock()), \
+             patch.object(launcher, '_stop_requested_within', new=AsyncMock(return_value=False)):
+            await launcher.launch_with_concurrent_diagnostics()
+            await launcher.launch_with_concurrent_diagnostics()
+
+        assert AsyncChromeLauncher._STRATEGIES == strategies
+        assert launcher.attempts[0].flags == ['--extra', *async_launcher._WAYLAND_FLAGS]
+        assert launcher.attempts[1].flags == launcher.attempts[3].flags == [
+            '--disable-gpu', '--extra', '--ozone-platform=x11', '--disable-features=UseOzonePlatform',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_run_concurrently(self, launcher):
+        """Test the three collectors overlap and one failure doesn't stop the rest."""
+        started = []
+        release = asyncio.Event()
+
+        async def collector(name):
+            started.append(name)
+            if len(started) == 3:
+                release.set()
+            # Only returns if all three collectors are running at once
+            await asyncio.wait_for(release.wait(), timeout=1)
+            if name == 'system':
+                raise RuntimeError('psutil failed')
+
+        with patch.object(launcher, '_collect_system_info', new=lambda: collector('system')), \
+             patch.object(launcher, '_monitor_dmesg', new=lambda: collector('dmesg')), \
+             patch.object(launcher, '_collect_journal_logs', new=lambda: collector('journal')):
+            await launcher._collect_concurrent_diagnostics()
+
+        assert sorted(started) == ['dmesg', 'journal', 'system']
+        launcher.logger.error.assert_called_once_with(
+            "diagnostics", "Error in concurrent diagnostics: psutil failed"
+        )
+
+    @pytest.mark.asyncio
+    async def test_unresponsive_chrome_is_reaped_in_background(self, launcher):
+        """Test a rejected attempt returns before its process has exited."""
+        attempt = LaunchAttempt(attempt_number=1, flags=[], strategy='test', start_time=0.0)
+        exited = asyncio.Event()
+
+        mock_process = AsyncMock()
+        mock_process.pid = 12345
+        mock_process.terminate = Mock()
+        mock_process.kill = Mock()
+        waits = []
+
+        async def wait():
+            # First wait(): still running at launch_timeout; afterwards block
+            # until the test lets the process exit
+            waits.append(None)
+            if len(waits) == 1:
+                raise asyncio.TimeoutError()
+            await exited.wait()
+
+        mock_process.wait.side_effect = wait
+
+        with patch('asyncio.create_subprocess_exec', new=AsyncMock(return_value=mock_process)), \
+             patch.object(launcher, '_verify_chrome_running', new=AsyncMock(return_value=False)):
+            result = await launcher._launch_chrome_async('chrome', [], attempt)
+
+            assert result is False
+            assert len(launcher._reapers) == 1
+
+            # Let the background reaper start: SIGTERM sent, exit pending
+            await asyncio.sleep(0)
+            mock_process.terminate.assert_called_once()
+            assert len(launcher._reapers) == 1
+
+            # The next attempt waits for the old process before launching
+            exited.set()
+            await launcher._drain_reapers()
+
+        assert not launcher._reapers
+        mock_process.kill.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_terminate_escalates_to_kill(self, launcher):
+        """Test a process ignoring SIGTERM is killed and reaped."""
+        mock_process = AsyncMock()
+        mock_process.terminate = Mock()
+        mock_process.kill = Mock()
+        mock_process.wait.side_effect = [asyncio.TimeoutError(), None]
+
+        await launcher._terminate(mock_process)
+
+        mock_process.kill.assert_called_once()
+        assert mock_process.wait.await_count == 2
 
     @pytest.mark.asyncio
     async def test_launch_chrome_async_success(self, launcher):
@@ -187,6 +461,32 @@ class TestAsyncChromeLauncher:
             # Should log system info
             launcher.logger.info.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_collect_system_info_caches_static_fields(self, launcher):
+        """Test only disk usage is re-read on later collections."""
+        from chrome_troubleshooter import async_launcher
+
+        async_launcher._static_system_info.cache_clear()
+        try:
+            with patch('psutil.cpu_count', return_value=4) as mock_cpu, \
+                 patch('psutil.virtual_memory') as mock_memory, \
+                 patch('psutil.disk_usage') as mock_disk:
+
+                mock_memory.return_value.total = 8000000000
+                mock_disk.return_value.percent = 50.0
+
+                await launcher._collect_system_info()
+                await launcher._collect_system_info()
+
+                assert mock_cpu.call_count == 1
+                assert mock_memory.call_count == 1
+                assert mock_disk.call_count == 2
+                logged = launcher.logger.info.call_args.args[1]
+                assert "'cpu_count': 4" in logged
+                assert "'disk_usage': 50.0" in logged
+        finally:
+            async_launcher._static_system_info.cache_clear()
+
     @pytest.mark.asyncio
     async def test_try_flatpak_fallback_success(self, launcher):
         """Test successful Flatpak fallback."""
@@ -267,3 +567,73 @@ class TestLaunchAttempt:
         assert attempt.end_time == 125.789
         assert attempt.success is True
         assert attempt.process_id == 12345
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_launch_attempt_is_slotted(self):
+        """Test LaunchAttempt carries no per-instance __dict__."""
+        attempt = LaunchAttempt(attempt_number=1, flags=[], strategy='vanilla', start_time=0.0)
+
+        assert not hasattr(attempt, '__dict__')
+        with pytest.raises(AttributeError):
+            attempt.unknown_field = True
+
+
+class TestWithTimeout:
+    """Test cases for the _with_timeout helper."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """Test a fast awaitable's result is passed through."""
+        from chrome_troubleshooter.async_launcher import _with_timeout
+
+        async def fast():
+            return 42
+
+        assert await _with_timeout(fast(), 1) == 42
+
+    @pytest.mark.asyncio
+    async def test_raises_on_deadline(self):
+        """Test a slow awaitable raises asyncio.TimeoutError."""
+        from chrome_troubleshooter.async_launcher import _with_timeout
+
+        with pytest.raises(asyncio.TimeoutError):
+            await _with_timeout(asyncio.sleep(5), 0.01)
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(asyncio, "timeout"), reason="needs asyncio.timeout")
+    async def test_runs_in_current_task(self):
+        """Test no wrapper Task is created where asyncio.timeout exists."""
+        from chrome_troubleshooter.async_launcher import _with_timeout
+
+        async def current():
+            return asyncio.current_task()
+
+        assert await _with_timeout(current(), 1) is asyncio.current_task()
+
+
+class TestIterLines:
+    """Test cases for the _iter_lines stream helper."""
+
+    @pytest.mark.asyncio
+    async def test_splits_across_chunks(self):
+        """Test lines split over reads are reassembled, tail included."""
+        from chrome_troubleshooter.async_launcher import _iter_lines
+
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"one\ntw")
+        stream.feed_data(b"o\nthree")
+        stream.feed_eof()
+
+        lines = [line async for line in _iter_lines(stream, 1, chunk_size=4)]
+        assert lines == [b"one", b"two", b"three"]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_deadline(self):
+        """Test an idle follower stops after the duration, not at EOF."""
+        from chrome_troubleshooter.async_launcher import _iter_lines
+
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"first\n")
+
+        lines = [line async for line in _iter_lines(stream, 0.05)]
+        assert lines == [b"first"]
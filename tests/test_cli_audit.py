@@ -135,3 +135,118 @@ def test_diag_help():
     result = runner.invoke(app, ["diag", "--help"])
     assert result.exit_code == 0
     assert "session" in result.stdout or "diagnostic" in result.stdout
+
+
+def test_import_defers_heavy_modules():
+    """
+    Test that importing the CLI does not load launcher/diagnostics/logger.
+
+    The launcher takes the single-instance lock at import time, so it must
+    only be imported by the launch command itself.
+    """
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, chrome_troubleshooter.cli\n"
+        "print(sorted(m for m in ('chrome_troubleshooter.launcher',"
+        " 'chrome_troubleshooter.diagnostics', 'chrome_troubleshooter.logger')"
+        " if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": ":".join(sys.path), "PATH": "/usr/bin:/bin"},
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_newest_session_picks_latest_name(tmp_path):
+    """Test the session lookup returns the newest session directory."""
+    from chrome_troubleshooter.utils import newest_session
+
+    for name in ("session_2024-01-02_00-00-00", "session_2025-06-01_12-00-00",
+                 "session_2023-12-31_23-59-59"):
+        (tmp_path / name).mkdir()
+    # Later-sorting names that aren't session directories are ignored
+    (tmp_path / "session_9999-zz").write_text("not a dir")
+    (tmp_path / "zzz_other").mkdir()
+
+    assert newest_session(tmp_path) == tmp_path / "session_2025-06-01_12-00-00"
+    assert newest_session(tmp_path / "missing") is None
+
+
+def test_create_session_dir_never_reuses_a_directory(tmp_path, monkeypatch):
+    """Test sessions started in the same second get distinct directories."""
+    from chrome_troubleshooter import utils
+
+    monkeypatch.setattr(utils.time, "strftime", lambda fmt: "session_20250601_120000")
+    first = utils.create_session_dir(tmp_path / "base")
+    second = utils.create_session_dir(tmp_path / "base")
+
+    assert first.name == "session_20250601_120000"
+    assert second.name == "session_20250601_120000_1"
+    assert first.is_dir() and second.is_dir()
+    assert utils.newest_session(tmp_path / "base") == second
+
+
+def test_create_session_dir_single_mkdir_when_base_exists(tmp_path, monkeypatch):
+    """Test an existing base directory costs one mkdir and no parents walk."""
+    from pathlib import Path
+
+    from chrome_troubleshooter import utils
+
+    calls = []
+    real_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        calls.append(self)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+    session = utils.create_session_dir(tmp_path)
+
+    assert calls == [session]
+    assert session.parent == tmp_path and session.is_dir()
+
+
+def test_export_sqlite_uses_newest_session(tmp_path, monkeypatch):
+    """Test export-sqlite prints the newest session's database path."""
+    import chrome_troubleshooter.cli as cli
+
+    (tmp_path / "session_2024-01-01_00-00-00").mkdir()
+    (tmp_path / "session_2024-02-01_00-00-00").mkdir()
+    monkeypatch.setattr(cli, "get_cache_dir", lambda: tmp_path)
+
+    result = CliRunner().invoke(app, ["export-sqlite"])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == str(tmp_path / "session_2024-02-01_00-00-00" / "logs.sqlite")
+
+
+def test_diag_without_session_exits_cleanly(tmp_path, monkeypatch):
+    """Test diag with no sessions reports only the missing-session error."""
+    import chrome_troubleshooter.cli as cli
+
+    monkeypatch.setattr(cli, "get_cache_dir", lambda: tmp_path)
+
+    result = CliRunner().invoke(app, ["diag"])
+    assert result.exit_code == 1
+    assert "No session found" in result.output
+    assert "Diagnostics failed" not in result.output
+
+
+def test_version_skips_package_metadata(monkeypatch):
+    """Test version prints the static version without a metadata lookup."""
+    import importlib.metadata
+
+    from chrome_troubleshooter import __version__
+
+    def fail(name):
+        raise AssertionError("importlib.metadata.version should not be called")
+
+    monkeypatch.setattr(importlib.metadata, "version", fail)
+    result = CliRunner().invoke(app, ["version"])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == __version__
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Tests for chrome_troubleshooter.cli_complex (argparse CLI)
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from argparse import Namespace
+
+import pytest
+
+from chrome_troubleshooter import __version__
+from chrome_troubleshooter.cli_complex import (
+    _HANDLERS,
+    _SUBCOMMAND_BUILDERS,
+    _dir_size,
+    _sniff_subcommand,
+    _write_json,
+    create_parser,
+    handle_clean,
+    handle_logs,
+)
+from chrome_troubleshooter.config import Config
+
+ALL_COMMANDS = list(_SUBCOMMAND_BUILDERS)
+
+
+def _built_commands(parser):
+    """Return the subcommand names registered on a parser"""
+    return list(parser._subparsers._group_actions[0].choices)
+
+
+class TestLazyParser:
+    """Test that create_parser only builds the subcommand being run"""
+
+    @pytest.mark.parametrize("command", ALL_COMMANDS)
+    def test_builds_only_invoked_subparser(self, command):
+        """Test each subcommand builds just its own subparser"""
+        parser = create_parser([command])
+        assert _built_commands(parser) == [command]
+        assert parser.parse_args([command]).command == command
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["--config-file", "x.json", "status"], "status"),
+            (["--config-file", "status", "logs", "--list"], "logs"),
+            (["--config-file=x.json", "clean"], "clean"),
+            (["-v", "logs", "--list"], "logs"),
+            (["-vv", "diagnose"], "diagnose"),
+            (["launch", "--timeout", "5"], "launch"),
+            ([], None),
+            (["-h"], None),
+            (["bogus"], None),
+        ],
+    )
+    def test_sniff_subcommand(self, argv, expected):
+        """Test subcommand detection skips global options and their values"""
+        assert _sniff_subcommand(argv) == expected
+
+    def test_every_subcommand_has_a_handler(self):
+        """Test the dispatch table and the parser agree on command names"""
+        assert set(_HANDLERS) == set(_SUBCOMMAND_BUILDERS)
+
+    def test_config_file_value_is_not_the_command(self):
+        """Test a --config-file value named like a command is skipped"""
+        parser = create_parser(["--config-file", "status", "logs", "--list"])
+        assert _built_commands(parser) == ["logs"]
+
+        args = parser.parse_args(["--config-file", "status", "logs", "--list"])
+        assert args.command == "logs"
+        assert str(args.config_file) == "status"
+        assert args.list is True
+
+    def test_config_file_equals_form(self):
+        """Test --config-file=VALUE is treated as a single token"""
+        argv = ["--config-file=x.json", "clean", "--dry-run"]
+        args = create_parser(argv).parse_args(argv)
+        assert args.command == "clean"
+        assert args.dry_run is True
+
+    def test_unknown_command_builds_everything(self, capsys):
+        """Test an unknown command still reports every valid choice"""
+        parser = create_parser(["bogus"])
+        assert _built_commands(parser) == ALL_COMMANDS
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(["bogus"])
+        err = capsys.readouterr().err
+        for command in ALL_COMMANDS:
+            assert command in err
+
+    def test_help_lists_every_command(self, capsys):
+        """Test -h shows the full command list"""
+        parser = create_parser(["-h"])
+        assert _built_commands(parser) == ALL_COMMANDS
+
+        with pytest.raises(SystemExit) as exc:
+            parser.parse_args(["-h"])
+        assert exc.value.code == 0
+        out = capsys.readouterr().out
+        for command in ALL_COMMANDS:
+            assert command in out
+
+
+class TestVersionFastPath:
+    """Test that --version is answered before the parser is built"""
+
+    def test_version_skips_argparse_typer_and_rich(self):
+        """Test main() prints __version__ without importing heavy modules"""
+        code = (
+            "import sys\n"
+            "sys.argv = ['chrome-troubleshooter', '--version']\n"
+            "from chrome_troubleshooter.cli_complex import main\n"
+            "rc = main()\n"
+            "print(rc, sorted(m for m in ('argparse', 'typer', 'rich')"
+            " if m in sys.modules))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        lines = result.stdout.strip().splitlines()
+        assert lines[0] == f"chrome-troubleshooter {__version__}"
+        assert lines[1] == "0 []"
+
+    def test_typer_app_is_built_on_access(self):
+        """Test the Typer front end is still reachable as module.app"""
+        from chrome_troubleshooter import cli_complex
+
+        app = cli_complex.app
+        assert cli_complex.app is app
+        assert {c.callback.__name__ for c in app.registered_commands} == {
+            "launch",
+            "diagnose",
+            "status",
+        }
+
+
+class TestDirSize:
+    """Test the os.scandir based session size helper"""
+
+    def _rglob_size(self, path):
+        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+    def test_matches_rglob_sum(self, tmp_path):
+        """Test nested files and symlinks are counted like the rglob sum"""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.log").write_bytes(b"1" * 5)
+        (tmp_path / "a" / "mid.log").write_bytes(b"2" * 7)
+        (tmp_path / "a" / "b" / "deep.log").write_bytes(b"3" * 11)
+        (tmp_path / "link.log").symlink_to(tmp_path / "a" / "mid.log")
+        (tmp_path / "dirlink").symlink_to(tmp_path / "a")
+        (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+
+        assert _dir_size(tmp_path) == self._rglob_size(tmp_path) == 30
+
+    def test_skips_unreadable_directory(self, tmp_path, monkeypatch):
+        """Test an unreadable subdirectory is skipped, not fatal"""
+        (tmp_path / "ok.log").write_bytes(b"x" * 4)
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.log").write_bytes(b"y" * 100)
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+        assert _dir_size(tmp_path) == 4
+
+    def test_missing_directory_is_zero(self, tmp_path):
+        """Test a session removed before sizing counts as empty"""
+        assert _dir_size(tmp_path / "gone") == 0
+
+
+class TestWriteJson:
+    """Test diagnostics JSON output"""
+
+    def _payload(self, tmp_path):
+        return {
+            "system_info": {"kernel": "6.1", "session": tmp_path},
+            "journal_logs": {"user_journal": ["line 1", "line 2"]},
+        }
+
+    def test_writes_readable_json(self, tmp_path):
+        """Test the output round-trips and non-JSON values become strings"""
+        import json
+
+        out = tmp_path / "diag.json"
+        _write_json(out, self._payload(tmp_path))
+
+        data = json.loads(out.read_text())
+        assert data["system_info"]["session"] == str(tmp_path)
+        assert data["journal_logs"]["user_journal"] == ["line 1", "line 2"]
+
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        """Test output is identical in content when orjson is missing"""
+        import json
+
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        out = tmp_path / "diag.json"
+        _write_json(out, self._payload(tmp_path))
+
+        assert json.loads(out.read_text())["system_info"]["kernel"] == "6.1"
+
+
+DAY = 24 * 60 * 60
+STAMP = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
+
+
+def _make_session(base_dir, name, age_days, payload=b"x" * 10):
+    """Create a session directory with one file and a given age"""
+    session = base_dir / name
+    session.mkdir()
+    (session / "launcher.log").write_bytes(payload)
+    mtime = time.time() - age_days * DAY
+    os.utime(session, (mtime, mtime))
+    return session
+
+
+class TestSessionHandlers:
+    """Test logs --list and clean against a temporary base_dir"""
+
+    @pytest.fixture
+    def config(self, tmp_path):
+        return Config(base_dir=tmp_path)
+
+    def test_logs_list_sorted_newest_first(self, config, capsys):
+        """Test sessions are listed newest first with second-precision stamps"""
+        _make_session(config.base_dir, "session_old", age_days=3)
+        _make_session(config.base_dir, "session_new", age_days=1, payload=b"abc")
+        _make_session(config.base_dir, "session_mid", age_days=2)
+        # Dangling entry: stat() fails, must be skipped rather than crash
+        (config.base_dir / "session_gone").symlink_to(config.base_dir / "missing")
+
+        args = Namespace(list=True, session=None, latest=False, format="text")
+        assert handle_logs(args, config) == 0
+
+        lines = [l for l in capsys.readouterr().out.splitlines() if "•" in l]
+        assert [l.split()[1] for l in lines] == [
+            "session_new",
+            "session_mid",
+            "session_old",
+        ]
+        assert re.fullmatch(rf"  • session_new - {STAMP} \(3 bytes\)", lines[0])
+
+    def test_clean_dry_run_selects_old_directories(self, config, capsys):
+        """Test clean --dry-run only reports directories past the cutoff"""
+        old = _make_session(config.base_dir, "session_old", age_days=10)
+        _make_session(config.base_dir, "diagnose_old", age_days=9)
+        _make_session(config.base_dir, "session_recent", age_days=1)
+        (config.base_dir / "session_file").write_text("not a dir")
+        os.utime(config.base_dir / "session_file", (0, 0))
+
+        args = Namespace(days=7, dry_run=True)
+        assert handle_clean(args, config) == 0
+
+        out = capsys.readouterr().out
+        assert re.search(rf"Would remove: session_old \({STAMP}, 10 bytes\)", out)
+        assert "diagnose_old" in out
+        assert "session_recent" not in out
+        assert "session_file" not in out
+        assert "Would remove 2 sessions, 20 bytes total" in out
+        assert old.exists()
+
+    def test_clean_removes_old_directories(self, config, capsys):
+        """Test clean deletes only the sessions past the cutoff"""
+        old = _make_session(config.base_dir, "session_old", age_days=10)
+        recent = _make_session(config.base_dir, "session_recent", age_days=1)
+
+        assert handle_clean(Namespace(days=7, dry_run=False), config) == 0
+
+        assert not old.exists()
+        assert recent.exists()
+        assert "Removed 1 sessions, 10 bytes total" in capsys.readouterr().out
+
+    def test_logs_latest_prints_newest_session(self, config, capsys):
+        """Test logs --latest shows the newest session's text log"""
+        _make_session(config.base_dir, "session_old", age_days=2, payload=b"old")
+        _make_session(config.base_dir, "session_new", age_days=1, payload=b"new")
+
+        args = Namespace(list=False, session=None, latest=True, format="text")
+        assert handle_logs(args, config) == 0
+        assert capsys.readouterr().out.startswith("new")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
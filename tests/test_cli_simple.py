@@ -3,6 +3,7 @@
 Tests for simplified CLI interface
 """
 
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -93,27 +94,104 @@ class TestMainFunction:
     """Test cases for the main function."""
 
     @patch('chrome_troubleshooter.cli_simple.app')
-    @patch('pathlib.Path.exists')
-    @patch('pathlib.Path.touch')
-    @patch('pathlib.Path.unlink')
-    def test_main_function_success(self, mock_unlink, mock_touch, mock_exists, mock_app):
+    def test_main_function_success(self, mock_app, tmp_path, monkeypatch):
         """Test successful main function execution."""
-        mock_exists.return_value = False  # No lock file exists
+        lock_file = tmp_path / "test.lock"
+        monkeypatch.setattr('chrome_troubleshooter._commands.LOCK_FILE', str(lock_file))
         mock_app.return_value = None
 
         # Should not raise any exception
         main()
 
-        mock_touch.assert_called_once()
         mock_app.assert_called_once()
-        mock_unlink.assert_called_once()
+        # The flock is released on exit, so a second run is not blocked
+        from chrome_troubleshooter.utils import acquire_instance_lock
+        fd = acquire_instance_lock(str(lock_file))
+        assert fd is not None
+        os.close(fd)
 
-    @patch('pathlib.Path.exists')
-    def test_main_function_lock_file_exists(self, mock_exists):
-        """Test main function when lock file exists."""
-        mock_exists.return_value = True  # Lock file exists
-
-        with pytest.raises(SystemExit) as exc_info:
-            main()
+    @patch('chrome_troubleshooter.cli_simple.app')
+    def test_main_function_lock_held(self, mock_app, tmp_path, monkeypatch):
+        """Test main function when another instance holds the lock."""
+        import fcntl
+
+        lock_file = tmp_path / "test.lock"
+        monkeypatch.setattr('chrome_troubleshooter._commands.LOCK_FILE', str(lock_file))
+        fd = os.open(lock_file, os.O_CREAT | os.O_RDWR)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        finally:
+            os.close(fd)
 
         assert exc_info.value.code == 1
+        mock_app.assert_not_called()
+
+    @patch('chrome_troubleshooter.cli_simple.app')
+    def test_stale_lock_file_does_not_block(self, mock_app, tmp_path, monkeypatch):
+        """Test a leftover lock file from a crashed run is not an error."""
+        lock_file = tmp_path / "test.lock"
+        lock_file.touch()
+        monkeypatch.setattr('chrome_troubleshooter._commands.LOCK_FILE', str(lock_file))
+
+        main()
+
+        mock_app.assert_called_once()
+
+
+@pytest.mark.parametrize("module", ["cli_simple", "cli_typer"])
+def test_import_defers_heavy_modules(module):
+    """Test importing the CLI loads neither rich extras nor the launcher."""
+    import subprocess
+    import sys
+
+    code = (
+        f"import sys, chrome_troubleshooter.{module}\n"
+        "print(sorted(m for m in ('rich.panel', 'rich.progress', 'rich.table',"
+        " 'chrome_troubleshooter.launcher', 'chrome_troubleshooter.diagnostics',"
+        " 'chrome_troubleshooter.logger') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": ":".join(sys.path), "PATH": "/usr/bin:/bin"},
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("terminal", [False, True])
+def test_launch_result_panel_only_on_terminal(terminal):
+    """Test the launch outcome is a panel on a TTY and plain text otherwise."""
+    import io
+
+    from rich.console import Console
+
+    from chrome_troubleshooter._commands import _print_result
+
+    out = io.StringIO()
+    console = Console(file=out, force_terminal=terminal, width=80)
+    _print_result(console, True, "Chrome launched successfully", "Session logs: /tmp/s")
+
+    text = out.getvalue()
+    assert "Session logs: /tmp/s" in text
+    if terminal:
+        assert "Success" in text and "╭" in text
+    else:
+        assert text == "Chrome launched successfully. Session logs: /tmp/s\n"
+
+
+@pytest.mark.parametrize("verbose", [[], ["-vv"]])
+@patch('chrome_troubleshooter.cli_simple.load_config')
+def test_traceback_only_with_vv(mock_load_config, verbose):
+    """Test the traceback is formatted only for -vv, and not as Rich markup."""
+    mock_load_config.side_effect = Exception("bad [red]config[/red]")
+
+    result = CliRunner().invoke(app, ["status", *verbose])
+
+    assert result.exit_code == 1
+    assert ("Traceback" in result.output) == bool(verbose)
+    if verbose:
+        assert "bad [red]config[/red]" in result.output
@@ -3,9 +3,11 @@
 Tests for chrome_troubleshooter.config module
 """
 
+import json
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -103,6 +105,25 @@ class TestConfig:
         os.environ.pop("CT_JOURNAL_LINES", None)
         os.environ.pop("CT_ROTATE_DAYS", None)
 
+    def test_base_dir_created_lazily(self, tmp_path):
+        """Test Config() does not create base_dir until asked to"""
+        base_dir = tmp_path / "cache" / "chrome_troubleshooter"
+        config = Config(base_dir=base_dir)
+        assert not base_dir.exists()
+
+        assert config.ensure_base_dir() == base_dir
+        assert base_dir.is_dir()
+
+    def test_default_lists_are_not_shared(self):
+        """Test each Config gets its own copy of the list defaults"""
+        first = Config()
+        second = Config()
+
+        first.chrome_paths.append("/custom/chrome")
+        first.extra_flags.append("--disable-gpu")
+        assert "/custom/chrome" not in second.chrome_paths
+        assert second.extra_flags == []
+
     def test_file_loading_and_saving(self):
         """Test configuration file loading and saving"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -124,6 +145,40 @@ class TestConfig:
             assert loaded_config.max_attempts == 8
             assert loaded_config.enable_colors is False
 
+    def test_config_file_parse_is_cached(self):
+        """Test unchanged config files are parsed once and edits are picked up"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "cached_config.json"
+            config_path.write_text('{"launch_timeout": 25}')
+
+            with patch(
+                "chrome_troubleshooter.config.json.load", wraps=json.load
+            ) as mock_load:
+                first = load_config(config_path)
+                second = load_config(config_path)
+                assert mock_load.call_count == 1
+                assert first is not second
+                assert first.extra_flags is not second.extra_flags
+
+                config_path.write_text('{"launch_timeout": 30, "max_attempts": 2}')
+                third = load_config(config_path)
+                assert mock_load.call_count == 2
+                assert third.launch_timeout == 30
+
+    def test_saved_file_contains_every_field(self):
+        """Test to_file writes all dataclass fields and no probe caches"""
+        from dataclasses import fields
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "all_fields.json"
+            config = Config()
+            config.validate_dependencies()
+            config.to_file(config_path)
+
+            saved = json.loads(config_path.read_text())
+            assert set(saved) == {f.name for f in fields(Config)}
+            assert saved["base_dir"] == str(config.base_dir)
+
     def test_chrome_executable_detection(self):
         """Test Chrome executable detection"""
         config = Config()
@@ -169,6 +224,74 @@ class TestConfig:
         # Python3 should always be available (we're running in Python)
         assert deps["python3"] is True
 
+    def test_dependency_probe_is_cached(self):
+        """Test dependency probes run once per Config until invalidated"""
+        config = Config()
+
+        with patch("shutil.which", return_value=None) as mock_which:
+            first = config.validate_dependencies()
+            second = config.validate_dependencies()
+            assert first == second
+            assert first["flock"] is False
+            calls = mock_which.call_count
+            assert calls == 8
+
+            config.invalidate_deps_cache()
+            config.validate_dependencies()
+            assert mock_which.call_count == 2 * calls
+
+    def test_invalidate_deps_cache_reprobes_path(self, tmp_path, monkeypatch):
+        """Test a command added to PATH is seen after invalidation"""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        config = Config()
+        assert config.validate_dependencies()["semanage"] is False
+
+        tool = tmp_path / "semanage"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+
+        # Memoized until invalidated
+        assert config.validate_dependencies()["semanage"] is False
+        config.invalidate_deps_cache()
+        assert config.validate_dependencies()["semanage"] is True
+
+        # A new Config probes PATH afresh
+        assert Config().validate_dependencies()["semanage"] is True
+
+    def test_chrome_executable_is_cached(self):
+        """Test Chrome lookups are memoized per chrome_paths list"""
+        config = Config()
+        config.chrome_paths = ["/usr/bin/python3"]
+
+        with patch("chrome_troubleshooter.config.os.stat", wraps=os.stat) as mock_stat:
+            assert config.get_chrome_executable() == "/usr/bin/python3"
+            assert config.get_chrome_executable() == "/usr/bin/python3"
+            assert mock_stat.call_count == 1
+
+            # Reassigning chrome_paths triggers a fresh lookup
+            config.chrome_paths = ["/nonexistent/chrome", "/usr/bin/python3"]
+            assert config.get_chrome_executable() == "/usr/bin/python3"
+            assert mock_stat.call_count == 3
+
+            # Invalidation clears the memo for the same path list
+            config.invalidate_deps_cache()
+            assert config._chrome_cache is None
+            assert config.get_chrome_executable() == "/usr/bin/python3"
+            assert mock_stat.call_count == 5
+
+    def test_chrome_executable_skips_non_executables(self, tmp_path):
+        """Test directories and files without an execute bit are skipped"""
+        plain = tmp_path / "chrome-plain"
+        plain.write_text("")
+        plain.chmod(0o644)
+        runnable = tmp_path / "chrome-runnable"
+        runnable.write_text("")
+        runnable.chmod(0o755)
+
+        config = Config()
+        config.chrome_paths = [str(tmp_path), str(plain), str(runnable)]
+        assert config.get_chrome_executable() == str(runnable)
+
     def test_missing_dependencies(self):
         """Test missing dependencies detection"""
         config = Config()
@@ -180,6 +303,18 @@ class TestConfig:
         assert isinstance(missing, list)
         assert "chrome" in missing  # Chrome should be missing with our mock paths
 
+    def test_precomputed_deps_are_reused(self, capsys):
+        """Test passing deps skips re-probing in the status helpers"""
+        config = Config()
+        deps = config.validate_dependencies()
+
+        with patch.object(config, "validate_dependencies") as mock_validate:
+            config.print_status(deps=deps)
+            config.get_missing_dependencies(deps=deps)
+            mock_validate.assert_not_called()
+
+        assert "Dependencies" in capsys.readouterr().out
+
     def test_print_status(self, capsys):
         """Test configuration status printing"""
         config = Config()
@@ -203,6 +338,17 @@ class TestConfig:
             config = load_config(config_path)
             assert config.launch_timeout == 10  # Default value
 
+    def test_invalid_json_file_warns_every_load(self, capsys):
+        """Test parse failures are not cached and warn on each load"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "broken_config.json"
+            config_path.write_text("{ invalid json }")
+
+            for _ in range(2):
+                config = load_config(config_path)
+                assert config.launch_timeout == 10
+                assert "Could not load config" in capsys.readouterr().out
+
     def test_nonexistent_config_file(self):
         """Test handling of nonexistent configuration file"""
         nonexistent_path = Path("/nonexistent/config.json")
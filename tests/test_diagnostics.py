@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Tests for chrome_troubleshooter.diagnostics module
+"""
+
+import subprocess
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from chrome_troubleshooter import diagnostics
+
+_read_kmsg = diagnostics._read_kmsg
+
+
+@pytest.fixture(autouse=True)
+def no_kmsg(monkeypatch):
+    """Send collection down the dmesg path; /dev/kmsg is often readable here"""
+    monkeypatch.setattr(diagnostics, "_read_kmsg", lambda since_seconds: None)
+
+
+@pytest.fixture(autouse=True)
+def sudo_group(monkeypatch):
+    """Make the sudo dmesg strategy eligible regardless of the test user"""
+    monkeypatch.setattr(diagnostics, "_user_groups", lambda: ("sudo",))
+
+
+class FakeLog:
+    """Minimal stand-in for StructuredLogger that records add() calls"""
+
+    def __init__(self):
+        self.entries = []
+
+    def add(self, source, message):
+        self.entries.append((source, message))
+
+
+def _which_all(name):
+    return f"/usr/bin/{name}"
+
+
+class TestCollectAll:
+    """Test the top-level diagnostic collection"""
+
+    def test_logs_dmesg_then_journal(self):
+        """Test both sources are logged in a fixed order"""
+        log = FakeLog()
+
+        def fake_output(cmd, **kwargs):
+            return b"kernel line\n" if cmd[0] == "/usr/bin/dmesg" else b"chrome line\n"
+
+        with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+            diagnostics.subprocess, "check_output", side_effect=fake_output
+        ):
+            diagnostics.collect_all(log)
+
+        assert log.entries == [("dmesg", "kernel line"), ("journal", "chrome line")]
+
+    def test_sources_are_collected_concurrently(self):
+        """Test dmesg and journalctl run at the same time"""
+        log = FakeLog()
+        # Each fake command waits for the other: only passes if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_output(cmd, **kwargs):
+            barrier.wait()
+            return cmd[0].encode()
+
+        with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+            diagnostics.subprocess, "check_output", side_effect=fake_output
+        ):
+            diagnostics.collect_all(log)
+
+        assert log.entries == [("dmesg", "/usr/bin/dmesg"), ("journal", "/usr/bin/journalctl")]
+
+    def test_missing_tools_are_reported(self):
+        """Test missing dmesg/journalctl produce explanatory entries"""
+        log = FakeLog()
+
+        with patch.object(diagnostics.shutil, "which", return_value=None):
+            diagnostics.collect_all(log)
+
+        assert log.entries == [
+            ("dmesg", "dmesg tool not available on this system"),
+            ("journal", "journalctl tool not available - non-systemd system"),
+        ]
+
+    def test_journal_failure_is_reported(self):
+        """Test a failing journalctl is logged rather than raised"""
+        log = FakeLog()
+
+        def fake_output(cmd, **kwargs):
+            if cmd[0] == "/usr/bin/journalctl":
+                raise subprocess.CalledProcessError(1, cmd)
+            return b""
+
+        with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+            diagnostics.subprocess, "check_output", side_effect=fake_output
+        ):
+            diagnostics.collect_all(log)
+
+        assert log.entries[0] == ("dmesg", "No recent kernel messages")
+        assert log.entries[1][0] == "journal"
+        assert "journalctl collection failed" in log.entries[1][1]
+
+    def test_unreadable_fallbacks_give_help(self):
+        """Test denied dmesg, sudo and /var/log/dmesg end in the help text"""
+        log = FakeLog()
+
+        def fake_output(cmd, **kwargs):
+            if cmd[0] == "/usr/bin/journalctl":
+                return b""
+            raise subprocess.CalledProcessError(1, cmd)
+
+        with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+            diagnostics.subprocess, "check_output", side_effect=fake_output
+        ), patch.object(diagnostics, "_read_tail", side_effect=PermissionError):
+            diagnostics.collect_all(log)
+
+        assert log.entries[0][1].startswith("dmesg unavailable: insufficient permissions")
+
+    def test_unexpected_errors_are_not_swallowed(self):
+        """Test only OS-level failures trigger the silent dmesg fallbacks"""
+
+        def fake_output(cmd, **kwargs):
+            if cmd[0] == "/usr/bin/sudo":
+                raise TypeError("bug")
+            raise subprocess.CalledProcessError(1, cmd)
+
+        with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+            diagnostics.subprocess, "check_output", side_effect=fake_output
+        ), pytest.raises(TypeError):
+            diagnostics._collect_dmesg_with_fallbacks()
+
+
+@pytest.mark.parametrize("partial, expected", [
+    (None, "journalctl timed out after 10s"),
+    (b"early line\n", "journalctl timed out after 10s: early line"),
+])
+def test_journal_timeout_is_reported(partial, expected):
+    """Test a slow journalctl is cut off and its partial output kept"""
+
+    def fake_output(cmd, timeout=None):
+        assert timeout == 10
+        raise subprocess.TimeoutExpired(cmd, timeout, output=partial)
+
+    with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+        diagnostics.subprocess, "check_output", side_effect=fake_output
+    ):
+        assert diagnostics._collect_journal() == expected
+
+
+def test_resolved_paths_are_exec_targets():
+    """Test probed tools run by absolute path, but sudo gets a bare dmesg"""
+    calls = []
+
+    def fake_output(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[0] == "/usr/bin/dmesg":
+            raise subprocess.CalledProcessError(1, cmd)
+        return b"ok"
+
+    with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+        diagnostics.subprocess, "check_output", side_effect=fake_output
+    ):
+        assert diagnostics._collect_dmesg_with_fallbacks() == "[via sudo] ok"
+        diagnostics._collect_journal()
+
+    assert [cmd[:3] for cmd in calls] == [
+        ["/usr/bin/dmesg", "--since", "-1min"],
+        ["/usr/bin/sudo", "-n", "dmesg"],
+        ["/usr/bin/journalctl", "-q", "-n"],
+    ]
+
+
+def test_sudo_skipped_outside_sudo_groups(monkeypatch):
+    """Test sudo isn't forked for users no group would let run it"""
+    monkeypatch.setattr(diagnostics, "_user_groups", lambda: ("users", "adm"))
+    calls = []
+
+    def fake_output(cmd, **kwargs):
+        calls.append(cmd[0])
+        raise subprocess.CalledProcessError(1, cmd)
+
+    with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+        diagnostics.subprocess, "check_output", side_effect=fake_output
+    ), patch.object(diagnostics, "_read_tail", side_effect=PermissionError):
+        result = diagnostics._collect_dmesg_with_fallbacks()
+
+    assert calls == ["/usr/bin/dmesg"]
+    assert result.startswith("dmesg unavailable")
+
+
+class TestKmsg:
+    """Test reading kernel messages straight from /dev/kmsg"""
+
+    def test_format_keeps_recent_records_like_dmesg_iso(self):
+        """Test old records, continuation lines and bad headers are dropped"""
+        records = [
+            b"6,1,5000000,-;old message\n",
+            b"4,2,90000000,-;recent message\n SUBSYSTEM=pci\n",
+            b"garbage without header\n",
+            b"3,3,95500000,c;another one\n",
+        ]
+        text = diagnostics._format_kmsg(records, cutoff=60, boot_time=1_700_000_000)
+
+        lines = text.splitlines()
+        assert [line.split(" ", 1)[1] for line in lines] == ["recent message", "another one"]
+        stamp = lines[0].split(" ", 1)[0]
+        assert diagnostics.datetime.fromisoformat(stamp).timestamp() == 1_700_000_090
+
+    def test_reads_until_drained_and_skips_overwritten(self, monkeypatch):
+        """Test EPIPE records are skipped and EAGAIN ends the read loop"""
+        reads = iter([
+            b"6,1,1,-;first\n",
+            BrokenPipeError(),
+            b"6,2,2,-;second\n",
+            BlockingIOError(),
+        ])
+
+        def fake_read(fd, size):
+            item = next(reads)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+        closed = []
+        monkeypatch.setattr(diagnostics.os, "open", lambda path, flags: 42)
+        monkeypatch.setattr(diagnostics.os, "read", fake_read)
+        monkeypatch.setattr(diagnostics.os, "close", closed.append)
+
+        text = _read_kmsg(10 ** 9)
+        assert [line.split(" ", 1)[1] for line in text.splitlines()] == ["first", "second"]
+        assert closed == [42]
+
+    def test_unreadable_kmsg_falls_back_to_dmesg(self, monkeypatch):
+        """Test a restricted /dev/kmsg returns None and dmesg is run instead"""
+
+        def denied(path, flags):
+            raise PermissionError(1, "Operation not permitted", path)
+
+        monkeypatch.setattr(diagnostics.os, "open", denied)
+        assert _read_kmsg(60) is None
+
+        monkeypatch.setattr(diagnostics, "_read_kmsg", _read_kmsg)
+        with patch.object(diagnostics.shutil, "which", _which_all), patch.object(
+            diagnostics.subprocess, "check_output", return_value=b"kernel line\n"
+        ) as check_output:
+            assert diagnostics._collect_dmesg_with_fallbacks() == "kernel line"
+        assert check_output.call_args[0][0][0] == "/usr/bin/dmesg"
+
+    def test_kmsg_skips_the_subprocess(self, monkeypatch):
+        """Test a readable /dev/kmsg means no dmesg process is spawned"""
+        monkeypatch.setattr(diagnostics, "_read_kmsg", lambda since_seconds: "")
+        with patch.object(diagnostics.subprocess, "check_output") as check_output:
+            assert diagnostics._collect_dmesg_with_fallbacks() == "No recent kernel messages"
+        check_output.assert_not_called()
+
+
+class TestCheckOutputText:
+    """Test byte capture with a single decode"""
+
+    def test_strips_and_drops_undecodable_bytes(self):
+        """Test output is stripped and invalid UTF-8 is ignored"""
+        with patch.object(
+            diagnostics.subprocess, "check_output", return_value=b"\n ok \xff\r\nnext \n"
+        ) as check_output:
+            assert diagnostics._check_output_text(["dmesg"], timeout=3) == "ok \r\nnext"
+
+        # Raw bytes are requested: no text=True decoding in subprocess
+        check_output.assert_called_once_with(["dmesg"], timeout=3)
+
+
+class TestReadTail:
+    """Test bounded tail reads of log files"""
+
+    def test_small_file_is_returned_whole(self, tmp_path):
+        """Test files shorter than the limit are returned unchanged"""
+        log = tmp_path / "dmesg"
+        log.write_text("first\nsecond\n")
+        assert diagnostics._read_tail(log, 2000) == "first\nsecond\n"
+
+    def test_large_file_keeps_only_whole_tail_lines(self, tmp_path):
+        """Test only the tail is read and the partial first line is dropped"""
+        log = tmp_path / "dmesg"
+        log.write_text("".join(f"line {i:04d}\n" for i in range(1000)))
+
+        tail = diagnostics._read_tail(log, 25)
+        assert tail == "line 0998\nline 0999\n"
+
+    @pytest.mark.parametrize("name", ["missing", "."])
+    def test_missing_file_or_directory_raises_oserror(self, tmp_path, name):
+        """Test the dmesg fallback can rely on OSError instead of probing"""
+        with pytest.raises(OSError):
+            diagnostics._read_tail(tmp_path / name, 2000)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the chrome_troubleshooter package namespace (lazy re-exports)
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import chrome_troubleshooter
+
+
+def _run_isolated(code: str) -> str:
+    """Run code in a fresh interpreter so sys.modules starts clean"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Test PEP 562 lazy attribute access on the package"""
+
+    def test_import_loads_no_submodules(self):
+        """Test importing the package does not import any submodule"""
+        out = _run_isolated(
+            "import sys, chrome_troubleshooter\n"
+            "print(sorted(m for m in sys.modules"
+            " if m.startswith('chrome_troubleshooter.')))"
+        )
+        assert out == "[]"
+
+    def test_star_import_stays_lazy(self):
+        """Test a star import only pulls in the version string"""
+        out = _run_isolated(
+            "import sys\n"
+            "from chrome_troubleshooter import *\n"
+            "print(sorted(m for m in sys.modules"
+            " if m.startswith('chrome_troubleshooter.')))"
+        )
+        assert out == "[]"
+        assert chrome_troubleshooter.__all__ == ["__version__"]
+
+    def test_attribute_access_resolves_and_caches(self):
+        """Test a lazy name resolves to the real object and is cached"""
+        from chrome_troubleshooter.config import Config
+
+        vars(chrome_troubleshooter).pop("Config", None)
+        assert chrome_troubleshooter.Config is Config
+        assert vars(chrome_troubleshooter)["Config"] is Config
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError"""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            chrome_troubleshooter.no_such_name
+
+    def test_dir_lists_lazy_names(self):
+        """Test dir() advertises the lazily exported names"""
+        names = dir(chrome_troubleshooter)
+        for name in ("Config", "StructuredLogger", "safe_launch", "collect_all"):
+            assert name in names
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_import_creates_no_cache_dir(tmp_path):
+    """Test importing the CLI and constants leaves the filesystem alone"""
+    env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run(
+        [sys.executable, "-c", "import chrome_troubleshooter.cli, chrome_troubleshooter.constants"],
+        env=env,
+        check=True,
+    )
+    assert not (tmp_path / ".cache").exists()
+
+
+def test_ensure_cache_dir_creates_on_demand(tmp_path, monkeypatch):
+    """Test ensure_cache_dir() creates and returns the cache directory"""
+    from chrome_troubleshooter.constants import APP_NAME, ensure_cache_dir, get_cache_dir
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert not get_cache_dir().exists()
+    assert ensure_cache_dir() == tmp_path / ".cache" / APP_NAME
+    assert get_cache_dir().is_dir()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for chrome_troubleshooter.launcher module
+"""
+
+import fcntl
+import os
+import subprocess
+import sys
+
+import pytest
+
+from chrome_troubleshooter import launcher
+
+
+@pytest.fixture
+def lock_path(tmp_path, monkeypatch):
+    """Point the launcher's lock at a private file and release it afterwards"""
+    path = tmp_path / "launcher.lock"
+    monkeypatch.setattr(launcher, "_LOCK", path)
+    yield path
+    launcher._release_lock()
+
+
+def test_import_takes_no_lock():
+    """Test importing the launcher opens and locks nothing"""
+    assert launcher._state == {}
+
+
+def test_acquire_lock_is_reentrant(lock_path):
+    """Test a second call in the same process reuses the held lock"""
+    first = launcher._acquire_lock()
+    assert launcher._acquire_lock() == first
+    assert lock_path.exists()
+
+
+def test_lock_fd_not_inherited(lock_path):
+    """Test the lock descriptor is close-on-exec, so Chrome can't keep it"""
+    fd = launcher._acquire_lock()
+    assert not os.get_inheritable(fd)
+
+
+def test_release_lock_frees_the_file(lock_path):
+    """Test another open file can take the lock once it is released"""
+    launcher._acquire_lock()
+    launcher._release_lock()
+    assert launcher._state == {}
+
+    with lock_path.open("r+") as other:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def test_acquire_lock_exits_when_held(lock_path):
+    """Test a lock held elsewhere aborts with exit code 1"""
+    lock_path.touch()
+    with lock_path.open("r+") as other:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        with pytest.raises(SystemExit) as exc:
+            launcher._acquire_lock()
+    assert exc.value.code == 1
+    assert launcher._state == {}
+
+
+def _popen(code):
+    """Start a Python child with stdout piped like safe_launch() does"""
+    return subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def test_drain_reads_more_than_a_pipe_buffer():
+    """Test a child writing past 64 KiB exits instead of stalling on the pipe"""
+    with _popen("import sys; sys.stdout.write('x' * 300000); sys.exit(3)") as proc:
+        output, exited = launcher._drain_until_exit(proc, timeout=10)
+    assert exited
+    assert proc.returncode == 3
+    assert len(output) == 300000
+
+
+def test_drain_times_out_on_a_running_child():
+    """Test a child still alive at the deadline is reported as not exited"""
+    with _popen("import time; print('up', flush=True); time.sleep(30)") as proc:
+        output, exited = launcher._drain_until_exit(proc, timeout=0.5)
+        proc.kill()
+    assert not exited
+    assert output == b"up\n"
@@ -4,6 +4,7 @@ Tests for chrome_troubleshooter.logger module
 """
 
 import json
+import os
 import sqlite3
 import tempfile
 import threading
@@ -281,3 +282,149 @@ class TestStructuredLogger:
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+class TestSessionRotation:
+    """Test scandir based rotation of old session directories"""
+
+    def _logger_in(self, cache_dir: Path) -> StructuredLogger:
+        # Bypass __init__: rotation only needs session_dir, and a full
+        # logger would open files and SQLite we don't care about here
+        logger = StructuredLogger.__new__(StructuredLogger)
+        logger.session_dir = cache_dir / "session_current"
+        return logger
+
+    def _make_session(self, cache_dir: Path, name: str, age_days: float, size: int = 10) -> Path:
+        session = cache_dir / name
+        (session / "sub").mkdir(parents=True)
+        (session / "sub" / "data.bin").write_bytes(b"x" * size)
+        stamp = time.time() - age_days * 86400
+        os.utime(session, (stamp, stamp))
+        return session
+
+    def test_rotates_expired_without_walking(self, tmp_path, monkeypatch, capsys):
+        """Expired sessions are archived without a size walk"""
+        from chrome_troubleshooter import logger as logger_mod
+
+        walked = []
+        monkeypatch.setattr(
+            logger_mod, "dir_size", lambda p: walked.append(p) or 0
+        )
+        self._make_session(tmp_path, "session_old", age_days=30)
+        self._make_session(tmp_path, "session_new", age_days=0)
+
+        self._logger_in(tmp_path)._rotate_old_sessions(max_age_days=7)
+
+        assert not (tmp_path / "session_old").exists()
+        assert (tmp_path / "session_old.tar.gz").exists()
+        assert (tmp_path / "session_new").exists()
+        # Only the fresh session needed its size checked
+        assert [Path(p).name for p in walked] == ["session_new"]
+        assert "Rotated session session_old (age)" in capsys.readouterr().out
+
+    def test_rotates_oversized(self, tmp_path, capsys):
+        """Fresh sessions over the size limit are still archived"""
+        self._make_session(tmp_path, "session_big", age_days=0, size=2 * 1024 * 1024)
+        self._make_session(tmp_path, "session_small", age_days=0)
+
+        self._logger_in(tmp_path)._rotate_old_sessions(max_size_mb=1)
+
+        assert (tmp_path / "session_big.tar.gz").exists()
+        assert (tmp_path / "session_small").exists()
+        assert "(size): 2,097,152 bytes" in capsys.readouterr().out
+
+    def test_ignores_other_entries(self, tmp_path):
+        """Non-session names and plain files are left alone"""
+        self._make_session(tmp_path, "diagnose_old", age_days=30)
+        (tmp_path / "session_file").write_text("not a dir")
+
+        self._logger_in(tmp_path)._rotate_old_sessions(max_age_days=7)
+
+        assert (tmp_path / "diagnose_old").exists()
+        assert (tmp_path / "session_file").exists()
+
+
+class TestBufferedWrites:
+    """Test the background writer that batches file and SQLite output"""
+
+    def test_entries_are_written_in_batches(self, tmp_path, monkeypatch):
+        """Test a burst of entries reaches the files in a few batches"""
+        batches = []
+        original = StructuredLogger._write_batch
+
+        def recording(self, batch):
+            batches.append(len(batch))
+            original(self, batch)
+
+        monkeypatch.setattr(StructuredLogger, "_write_batch", recording)
+        with StructuredLogger(tmp_path) as logger:
+            for i in range(50):
+                logger.info("burst", f"Message {i}")
+
+        # 50 burst entries + session start/end + total
+        assert sum(batches) == 53
+        assert len(batches) < 53
+
+        lines = logger.json_file.read_text().splitlines()
+        burst = [json.loads(line)["content"] for line in lines if '"burst"' in line]
+        assert burst == [f"Message {i}" for i in range(50)]
+
+        conn = sqlite3.connect(str(logger.db_file))
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM logs WHERE source = 'burst'").fetchone()[0]
+        finally:
+            conn.close()
+        assert count == 50
+
+    def test_flush_makes_entries_visible(self, tmp_path):
+        """Test flush() waits until pending entries are on disk"""
+        logger = StructuredLogger(tmp_path, enable_sqlite=False)
+        try:
+            logger.info("test", "Flushed message")
+            logger.flush()
+            assert "Flushed message" in logger.log_file.read_text()
+            assert "Flushed message" in logger.json_file.read_text()
+        finally:
+            logger.close()
+
+    def test_close_is_idempotent(self, tmp_path):
+        """Test close() can run twice and later entries don't block"""
+        logger = StructuredLogger(tmp_path, enable_sqlite=False)
+        logger.close()
+        logger.close()
+        logger.info("test", "After close")  # terminal only, must not block
+        logger.flush()
+
+        text = logger.log_file.read_text()
+        assert text.count("Session ended") == 1
+        assert "After close" not in text
+
+    def test_get_stats_reports_file_sizes(self, tmp_path):
+        """Test get_stats() adds sizes that include pending entries"""
+        with StructuredLogger(tmp_path) as logger:
+            logger.info("test", "Message")
+            files = logger.get_stats()["files"]
+
+            assert "Message" in logger.log_file.read_text()
+            assert files["log_file_size"] == logger.log_file.stat().st_size
+            assert files["json_file_size"] == logger.json_file.stat().st_size
+
+
+def test_import_defers_rotation_and_subprocess_modules():
+    """Test importing the logger does not load gzip, subprocess or textwrap"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, chrome_troubleshooter.logger\n"
+        "print(sorted(m for m in ('gzip', 'subprocess', 'textwrap')"
+        " if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": ":".join(sys.path), "PATH": "/usr/bin:/bin"},
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"